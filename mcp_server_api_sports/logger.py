@@ -144,6 +144,16 @@ def get_logger(name: str | None = None) -> "Logger":
     return logger
 
 
+def is_level_enabled(level: str) -> bool:
+    """Check whether records at the given level pass the configured log level.
+
+    Lets hot paths skip building log messages and extra dicts that would be
+    filtered out anyway.
+    """
+    settings = get_settings()
+    return bool(logger.level(level).no >= logger.level(settings.log_level).no)
+
+
 # Performance logging decorator
 def log_performance(func: Any) -> Any:
     """Decorator to log function performance."""
@@ -1,9 +1,12 @@
 """Main MCP server implementation for API-Sports."""
 
 import asyncio
-import json
 from typing import Any
 
+import orjson
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
@@ -15,6 +18,349 @@ from .services import ApiSportsService, CacheService
 logger = get_logger(__name__)
 
 
+def _to_json(value: Any, indent: bool = False) -> str:
+    """Serialize a tool result or error payload to JSON text."""
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(value, default=str, option=option).decode()
+
+
+# Tool definitions are static, so they are built once at import time
+_TOOLS: list[Tool] = [
+    Tool(
+        name="teams_search",
+        description="Search for football teams and retrieve their information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": ["string", "integer"],
+                    "description": "Team ID"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "Team name"
+                },
+                "league": {
+                    "type": ["string", "integer"],
+                    "description": "League ID"
+                },
+                "season": {
+                    "type": ["string", "integer"],
+                    "description": "Season year (YYYY)"
+                },
+                "country": {
+                    "type": "string",
+                    "description": "Country name"
+                },
+                "code": {
+                    "type": "string",
+                    "description": "3-letter team code"
+                },
+                "venue": {
+                    "type": ["string", "integer"],
+                    "description": "Venue ID"
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Search string (minimum 3 characters)"
+                }
+            }
+        },
+    ),
+    Tool(
+        name="fixtures_get",
+        description="Retrieve football fixtures (matches) with comprehensive filtering. Note: When using 'league' or 'team' parameter, 'season' is required.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": ["string", "integer"],
+                    "description": "Fixture ID"
+                },
+                "ids": {
+                    "type": "string",
+                    "description": "Multiple fixture IDs (delimiter '-', max 20)"
+                },
+                "live": {
+                    "type": "string",
+                    "description": "'all' or league IDs for live fixtures"
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Date in YYYY-MM-DD format"
+                },
+                "league": {
+                    "type": ["string", "integer"],
+                    "description": "League ID (requires 'season' parameter)"
+                },
+                "season": {
+                    "type": ["string", "integer"],
+                    "description": "Season year (YYYY) - required when using 'league' or 'team'"
+                },
+                "team": {
+                    "type": ["string", "integer"],
+                    "description": "Team ID (requires 'season' parameter)"
+                },
+                "last": {
+                    "type": ["string", "integer"],
+                    "description": "Last N matches (max 99)"
+                },
+                "next": {
+                    "type": ["string", "integer"],
+                    "description": "Next N matches (max 99)"
+                },
+                "from": {
+                    "type": "string",
+                    "description": "Start date (YYYY-MM-DD)"
+                },
+                "to": {
+                    "type": "string",
+                    "description": "End date (YYYY-MM-DD)"
+                },
+                "round": {
+                    "type": "string",
+                    "description": "Round name"
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Match status (NS, PST, FT, etc.)"
+                },
+                "venue": {
+                    "type": ["string", "integer"],
+                    "description": "Venue ID"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone for dates"
+                }
+            }
+        },
+    ),
+    Tool(
+        name="team_statistics",
+        description="Get comprehensive statistics for a team in a specific league and season",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "league": {
+                    "type": ["string", "integer"],
+                    "description": "League ID (required)"
+                },
+                "season": {
+                    "type": ["string", "integer"],
+                    "description": "Season year YYYY (required)"
+                },
+                "team": {
+                    "type": ["string", "integer"],
+                    "description": "Team ID (required)"
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Date up to which statistics are calculated (YYYY-MM-DD)"
+                }
+            },
+            "required": ["league", "season", "team"]
+        },
+    ),
+    Tool(
+        name="standings",
+        description="Get current league standings/table",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "league": {
+                    "type": ["string", "integer"],
+                    "description": "League ID (required)"
+                },
+                "season": {
+                    "type": ["string", "integer"],
+                    "description": "Season year YYYY (required)"
+                },
+                "team": {
+                    "type": ["string", "integer"],
+                    "description": "Optional team ID to get standings for a specific team"
+                }
+            },
+            "required": ["league", "season"]
+        },
+    ),
+    Tool(
+        name="head2head",
+        description="Get head-to-head comparison between two teams",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "h2h": {
+                    "type": "string",
+                    "description": "Teams IDs separated by dash, e.g. '33-34' (required)"
+                },
+                "date": {
+                    "type": "string",
+                    "description": "Date in YYYY-MM-DD format"
+                },
+                "league": {
+                    "type": ["string", "integer"],
+                    "description": "League ID"
+                },
+                "season": {
+                    "type": ["string", "integer"],
+                    "description": "Season year (YYYY)"
+                },
+                "last": {
+                    "type": ["string", "integer"],
+                    "description": "Last N matches"
+                },
+                "next": {
+                    "type": ["string", "integer"],
+                    "description": "Next N matches"
+                },
+                "from": {
+                    "type": "string",
+                    "description": "Start date (YYYY-MM-DD)"
+                },
+                "to": {
+                    "type": "string",
+                    "description": "End date (YYYY-MM-DD)"
+                },
+                "status": {
+                    "type": "string",
+                    "description": "Match status"
+                },
+                "venue": {
+                    "type": ["string", "integer"],
+                    "description": "Venue ID"
+                },
+                "timezone": {
+                    "type": "string",
+                    "description": "Timezone for dates"
+                }
+            },
+            "required": ["h2h"]
+        },
+    ),
+    Tool(
+        name="fixture_statistics",
+        description="Get detailed match statistics for a specific fixture",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "fixture": {
+                    "type": ["string", "integer"],
+                    "description": "Fixture ID (required)"
+                }
+            },
+            "required": ["fixture"]
+        },
+    ),
+    Tool(
+        name="fixture_events",
+        description="Get timeline of events (goals, cards, substitutions) for a fixture",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "fixture": {
+                    "type": ["string", "integer"],
+                    "description": "Fixture ID (required)"
+                }
+            },
+            "required": ["fixture"]
+        },
+    ),
+    Tool(
+        name="fixture_lineups",
+        description="Get team lineups and formations for a fixture",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "fixture": {
+                    "type": ["string", "integer"],
+                    "description": "Fixture ID (required)"
+                }
+            },
+            "required": ["fixture"]
+        },
+    ),
+    Tool(
+        name="predictions",
+        description="Get match predictions and betting advice for a fixture",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "fixture": {
+                    "type": ["string", "integer"],
+                    "description": "Fixture ID (required)"
+                }
+            },
+            "required": ["fixture"]
+        },
+    ),
+    Tool(
+        name="leagues_search",
+        description="Get the list of available leagues and cups with comprehensive filtering",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "id": {
+                    "type": ["string", "integer"],
+                    "description": "League ID"
+                },
+                "name": {
+                    "type": "string",
+                    "description": "League name"
+                },
+                "country": {
+                    "type": "string",
+                    "description": "Country name"
+                },
+                "code": {
+                    "type": "string",
+                    "description": "Country code (2-6 characters, e.g. FR, GB-ENG, IT)"
+                },
+                "season": {
+                    "type": ["string", "integer"],
+                    "description": "Season year (YYYY)"
+                },
+                "team": {
+                    "type": ["string", "integer"],
+                    "description": "Team ID"
+                },
+                "type": {
+                    "type": "string",
+                    "description": "Type of league ('league' or 'cup')",
+                    "enum": ["league", "cup"]
+                },
+                "current": {
+                    "type": "string",
+                    "description": "Return active seasons or last completed ('true' or 'false')",
+                    "enum": ["true", "false"]
+                },
+                "search": {
+                    "type": "string",
+                    "description": "Search string for league name or country (minimum 3 characters)"
+                },
+                "last": {
+                    "type": ["string", "integer"],
+                    "description": "Last N leagues/cups added to the API (max 99)"
+                }
+            }
+        },
+    ),
+]
+
+
+def _compile_validator(schema: dict[str, Any]) -> Validator:
+    """Check a tool input schema once and build a reusable validator for it."""
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+# Input validators per tool, built once instead of on every call
+_VALIDATORS: dict[str, Validator] = {
+    tool.name: _compile_validator(tool.inputSchema) for tool in _TOOLS
+}
+
+
 class ApiSportsMCPServer:
     """MCP Server for API-Sports integration."""
 
@@ -42,334 +388,21 @@ class ApiSportsMCPServer:
         @self.server.list_tools()
         async def list_tools() -> list[Tool]:
             """List available tools."""
-            tools = [
-                Tool(
-                    name="teams_search",
-                    description="Search for football teams and retrieve their information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "id": {
-                                "type": ["string", "integer"],
-                                "description": "Team ID"
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "Team name"
-                            },
-                            "league": {
-                                "type": ["string", "integer"],
-                                "description": "League ID"
-                            },
-                            "season": {
-                                "type": ["string", "integer"],
-                                "description": "Season year (YYYY)"
-                            },
-                            "country": {
-                                "type": "string",
-                                "description": "Country name"
-                            },
-                            "code": {
-                                "type": "string",
-                                "description": "3-letter team code"
-                            },
-                            "venue": {
-                                "type": ["string", "integer"],
-                                "description": "Venue ID"
-                            },
-                            "search": {
-                                "type": "string",
-                                "description": "Search string (minimum 3 characters)"
-                            }
-                        }
-                    },
-                ),
-                Tool(
-                    name="fixtures_get",
-                    description="Retrieve football fixtures (matches) with comprehensive filtering. Note: When using 'league' or 'team' parameter, 'season' is required.",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "id": {
-                                "type": ["string", "integer"],
-                                "description": "Fixture ID"
-                            },
-                            "ids": {
-                                "type": "string",
-                                "description": "Multiple fixture IDs (delimiter '-', max 20)"
-                            },
-                            "live": {
-                                "type": "string",
-                                "description": "'all' or league IDs for live fixtures"
-                            },
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format"
-                            },
-                            "league": {
-                                "type": ["string", "integer"],
-                                "description": "League ID (requires 'season' parameter)"
-                            },
-                            "season": {
-                                "type": ["string", "integer"],
-                                "description": "Season year (YYYY) - required when using 'league' or 'team'"
-                            },
-                            "team": {
-                                "type": ["string", "integer"],
-                                "description": "Team ID (requires 'season' parameter)"
-                            },
-                            "last": {
-                                "type": ["string", "integer"],
-                                "description": "Last N matches (max 99)"
-                            },
-                            "next": {
-                                "type": ["string", "integer"],
-                                "description": "Next N matches (max 99)"
-                            },
-                            "from": {
-                                "type": "string",
-                                "description": "Start date (YYYY-MM-DD)"
-                            },
-                            "to": {
-                                "type": "string",
-                                "description": "End date (YYYY-MM-DD)"
-                            },
-                            "round": {
-                                "type": "string",
-                                "description": "Round name"
-                            },
-                            "status": {
-                                "type": "string",
-                                "description": "Match status (NS, PST, FT, etc.)"
-                            },
-                            "venue": {
-                                "type": ["string", "integer"],
-                                "description": "Venue ID"
-                            },
-                            "timezone": {
-                                "type": "string",
-                                "description": "Timezone for dates"
-                            }
-                        }
-                    },
-                ),
-                Tool(
-                    name="team_statistics",
-                    description="Get comprehensive statistics for a team in a specific league and season",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "league": {
-                                "type": ["string", "integer"],
-                                "description": "League ID (required)"
-                            },
-                            "season": {
-                                "type": ["string", "integer"],
-                                "description": "Season year YYYY (required)"
-                            },
-                            "team": {
-                                "type": ["string", "integer"],
-                                "description": "Team ID (required)"
-                            },
-                            "date": {
-                                "type": "string",
-                                "description": "Date up to which statistics are calculated (YYYY-MM-DD)"
-                            }
-                        },
-                        "required": ["league", "season", "team"]
-                    },
-                ),
-                Tool(
-                    name="standings",
-                    description="Get current league standings/table",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "league": {
-                                "type": ["string", "integer"],
-                                "description": "League ID (required)"
-                            },
-                            "season": {
-                                "type": ["string", "integer"],
-                                "description": "Season year YYYY (required)"
-                            },
-                            "team": {
-                                "type": ["string", "integer"],
-                                "description": "Optional team ID to get standings for a specific team"
-                            }
-                        },
-                        "required": ["league", "season"]
-                    },
-                ),
-                Tool(
-                    name="head2head",
-                    description="Get head-to-head comparison between two teams",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "h2h": {
-                                "type": "string",
-                                "description": "Teams IDs separated by dash, e.g. '33-34' (required)"
-                            },
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format"
-                            },
-                            "league": {
-                                "type": ["string", "integer"],
-                                "description": "League ID"
-                            },
-                            "season": {
-                                "type": ["string", "integer"],
-                                "description": "Season year (YYYY)"
-                            },
-                            "last": {
-                                "type": ["string", "integer"],
-                                "description": "Last N matches"
-                            },
-                            "next": {
-                                "type": ["string", "integer"],
-                                "description": "Next N matches"
-                            },
-                            "from": {
-                                "type": "string",
-                                "description": "Start date (YYYY-MM-DD)"
-                            },
-                            "to": {
-                                "type": "string",
-                                "description": "End date (YYYY-MM-DD)"
-                            },
-                            "status": {
-                                "type": "string",
-                                "description": "Match status"
-                            },
-                            "venue": {
-                                "type": ["string", "integer"],
-                                "description": "Venue ID"
-                            },
-                            "timezone": {
-                                "type": "string",
-                                "description": "Timezone for dates"
-                            }
-                        },
-                        "required": ["h2h"]
-                    },
-                ),
-                Tool(
-                    name="fixture_statistics",
-                    description="Get detailed match statistics for a specific fixture",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "fixture": {
-                                "type": ["string", "integer"],
-                                "description": "Fixture ID (required)"
-                            }
-                        },
-                        "required": ["fixture"]
-                    },
-                ),
-                Tool(
-                    name="fixture_events",
-                    description="Get timeline of events (goals, cards, substitutions) for a fixture",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "fixture": {
-                                "type": ["string", "integer"],
-                                "description": "Fixture ID (required)"
-                            }
-                        },
-                        "required": ["fixture"]
-                    },
-                ),
-                Tool(
-                    name="fixture_lineups",
-                    description="Get team lineups and formations for a fixture",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "fixture": {
-                                "type": ["string", "integer"],
-                                "description": "Fixture ID (required)"
-                            }
-                        },
-                        "required": ["fixture"]
-                    },
-                ),
-                Tool(
-                    name="predictions",
-                    description="Get match predictions and betting advice for a fixture",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "fixture": {
-                                "type": ["string", "integer"],
-                                "description": "Fixture ID (required)"
-                            }
-                        },
-                        "required": ["fixture"]
-                    },
-                ),
-                Tool(
-                    name="leagues_search",
-                    description="Get the list of available leagues and cups with comprehensive filtering",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "id": {
-                                "type": ["string", "integer"],
-                                "description": "League ID"
-                            },
-                            "name": {
-                                "type": "string",
-                                "description": "League name"
-                            },
-                            "country": {
-                                "type": "string",
-                                "description": "Country name"
-                            },
-                            "code": {
-                                "type": "string",
-                                "description": "Country code (2-6 characters, e.g. FR, GB-ENG, IT)"
-                            },
-                            "season": {
-                                "type": ["string", "integer"],
-                                "description": "Season year (YYYY)"
-                            },
-                            "team": {
-                                "type": ["string", "integer"],
-                                "description": "Team ID"
-                            },
-                            "type": {
-                                "type": "string",
-                                "description": "Type of league ('league' or 'cup')",
-                                "enum": ["league", "cup"]
-                            },
-                            "current": {
-                                "type": "string",
-                                "description": "Return active seasons or last completed ('true' or 'false')",
-                                "enum": ["true", "false"]
-                            },
-                            "search": {
-                                "type": "string",
-                                "description": "Search string for league name or country (minimum 3 characters)"
-                            },
-                            "last": {
-                                "type": ["string", "integer"],
-                                "description": "Last N leagues/cups added to the API (max 99)"
-                            }
-                        }
-                    },
-                ),
-            ]
-
-            logger.debug(f"Listed {len(tools)} tools")
-            return tools
-
-        @self.server.call_tool()
+            logger.debug(f"Listed {len(_TOOLS)} tools")
+            return _TOOLS
+
+        # Arguments are validated against the precompiled _VALIDATORS below
+        # rather than by the SDK, which re-checks the schema on every call
+        @self.server.call_tool(validate_input=False)
         async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             """Execute a tool with given arguments."""
+            validator = _VALIDATORS.get(name)
+            if validator is not None:
+                error = best_match(validator.iter_errors(arguments))
+                if error is not None:
+                    # Raised so the SDK reports it exactly as its own validation would
+                    raise ValueError(f"Input validation error: {error.message}")
+
             logger.info(
                 f"Calling tool: {name}",
                 extra={"tool": name, "arguments": arguments}
@@ -402,7 +435,7 @@ class ApiSportsMCPServer:
                     if missing:
                         error_msg = f"Missing required parameters: {', '.join(missing)}"
                         logger.error(error_msg)
-                        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+                        return [TextContent(type="text", text=_to_json({"error": error_msg}))]
                 
                 elif name == "standings":
                     required = ["league", "season"]
@@ -410,19 +443,19 @@ class ApiSportsMCPServer:
                     if missing:
                         error_msg = f"Missing required parameters: {', '.join(missing)}"
                         logger.error(error_msg)
-                        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+                        return [TextContent(type="text", text=_to_json({"error": error_msg}))]
                 
                 elif name == "head2head":
                     if "h2h" not in cleaned_args:
                         error_msg = "Missing required parameter: h2h"
                         logger.error(error_msg)
-                        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+                        return [TextContent(type="text", text=_to_json({"error": error_msg}))]
                 
                 elif name in ["fixture_statistics", "fixture_events", "fixture_lineups", "predictions"]:
                     if "fixture" not in cleaned_args:
                         error_msg = "Missing required parameter: fixture"
                         logger.error(error_msg)
-                        return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+                        return [TextContent(type="text", text=_to_json({"error": error_msg}))]
 
                 if name == "teams_search":
                     result = await self.api_service.search_teams(**cleaned_args)
@@ -470,10 +503,10 @@ class ApiSportsMCPServer:
                 else:
                     error_msg = f"Unknown tool: {name}"
                     logger.error(error_msg)
-                    return [TextContent(type="text", text=json.dumps({"error": error_msg}))]
+                    return [TextContent(type="text", text=_to_json({"error": error_msg}))]
 
                 # Format result as JSON string
-                result_json = json.dumps(result, indent=2, default=str)
+                result_json = _to_json(result, indent=True)
 
                 logger.success(
                     f"Tool {name} executed successfully",
@@ -487,7 +520,7 @@ class ApiSportsMCPServer:
                 logger.error(error_msg, extra={"tool": name, "error": str(e)})
                 return [TextContent(
                     type="text",
-                    text=json.dumps({"error": error_msg})
+                    text=_to_json({"error": error_msg})
                 )]
 
     async def cleanup(self) -> None:
@@ -505,7 +538,7 @@ class ApiSportsMCPServer:
             async def cache_cleanup_task() -> None:
                 while True:
                     await asyncio.sleep(300)  # Every 5 minutes
-                    cleaned = await self.cache_service.cleanup_expired()
+                    cleaned = self.cache_service.cleanup_expired()
                     if cleaned > 0:
                         logger.debug(f"Cleaned {cleaned} expired cache entries")
 
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
+import os
+import sys
 import time
-import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from datetime import date as date_cls
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 from pydantic import ValidationError
 
 from ..config import get_settings
-from ..logger import get_logger, log_performance
+from ..logger import get_logger, is_level_enabled, log_performance
 from ..models import ApiResponse
 
 if TYPE_CHECKING:
@@ -20,60 +27,261 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Shared read-only fallback for missing nested objects in API payloads
+_EMPTY: dict[str, Any] = {}
+
+# Fixture statuses that will not change anymore (cached with the completed TTL)
+_COMPLETED_STATUSES = frozenset({"FT", "AET", "PEN", "PST", "CANC", "ABD", "AWD", "WO"})
+
+# Fields copied verbatim from each team and venue in a teams response
+_TEAM_KEYS = ("id", "name", "code", "country", "founded", "national", "logo")
+_VENUE_KEYS = ("id", "name", "address", "city", "capacity", "surface", "image")
+
+# Request IDs only correlate log lines, so a counter prefixed with the
+# process ID is enough to keep them apart across server processes
+_PID = os.getpid()
+_REQUEST_IDS = itertools.count()
+
+
+def _reset_request_ids() -> None:
+    """Give a forked worker its own request ID prefix and counter."""
+    global _PID, _REQUEST_IDS
+    _PID = os.getpid()
+    _REQUEST_IDS = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows
+    os.register_at_fork(after_in_child=_reset_request_ids)
+
+
+# Fixed validation messages shared by several tools
+_DATE_FORMAT_ERROR = "Date must be in YYYY-MM-DD format"
+_SEARCH_TOO_SHORT_ERROR = "Search parameter must be at least 3 characters long"
+
+
+def _error(message: str, request_id: str) -> dict[str, Any]:
+    """Build the error payload returned by the formatted tool methods."""
+    return {"error": message, "request_id": request_id}
+
+
+def _is_valid_date(value: str) -> bool:
+    """Check that a string is a real calendar date in YYYY-MM-DD format."""
+    # Cheap shape check first, so malformed input never reaches the parser
+    if not (
+        len(value) == 10
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[:4].isdigit()
+        and value[5:7].isdigit()
+        and value[8:].isdigit()
+    ):
+        return False
+    try:
+        date_cls.fromisoformat(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _dig(obj: Any, path: tuple[str, ...]) -> Any:
+    """Follow a path of keys through nested dicts, returning None on any miss."""
+    for key in path:
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def _leaves(schema: dict[str, Any]) -> tuple[tuple[str, ...], ...]:
+    """Flatten a schema whose leaves are key paths into its paths, in key order."""
+    return tuple(
+        path
+        for spec in schema.values()
+        for path in ((spec,) if isinstance(spec, tuple) else _leaves(spec))
+    )
+
+
+def _render(schema: dict[str, Any], values: Iterator[Any]) -> dict[str, Any]:
+    """Build a nested dict from a schema, taking leaf values in _leaves order."""
+    return {
+        key: next(values) if isinstance(spec, tuple) else _render(spec, values)
+        for key, spec in schema.items()
+    }
+
+
+# Minute buckets used by the API for card distributions; interned because,
+# unlike identifier-like keys, literals containing "-" are not interned by
+# the compiler
+_CARD_BUCKETS = tuple(
+    sys.intern(bucket)
+    for bucket in ("0-15", "16-30", "31-45", "46-60", "61-75", "76-90", "91-105", "106-120")
+)
+
+# Output shape of formatted team statistics; leaves are paths into the API payload
+_STATS_SCHEMA: dict[str, Any] = {
+    "league": {
+        "id": ("league", "id"),
+        "name": ("league", "name"),
+        "country": ("league", "country"),
+        "logo": ("league", "logo"),
+        "flag": ("league", "flag"),
+        "season": ("league", "season"),
+    },
+    "team": {
+        "id": ("team", "id"),
+        "name": ("team", "name"),
+        "logo": ("team", "logo"),
+    },
+    "form": ("form",),
+    "fixtures": {
+        "played": ("fixtures", "played"),
+        "wins": ("fixtures", "wins"),
+        "draws": ("fixtures", "draws"),
+        "loses": ("fixtures", "loses"),
+    },
+    "goals": {
+        side: {
+            "total": ("goals", side, "total"),
+            "average": ("goals", side, "average"),
+            "minute": ("goals", side, "minute"),
+            "under_over": ("goals", side, "under_over"),
+        }
+        for side in ("for", "against")
+    },
+    "biggest": {
+        "streak": ("biggest", "streak"),
+        "wins": ("biggest", "wins"),
+        "loses": ("biggest", "loses"),
+        "goals": ("biggest", "goals"),
+    },
+    "clean_sheet": {
+        "home": ("clean_sheet", "home"),
+        "away": ("clean_sheet", "away"),
+        "total": ("clean_sheet", "total"),
+    },
+    "failed_to_score": {
+        "home": ("failed_to_score", "home"),
+        "away": ("failed_to_score", "away"),
+        "total": ("failed_to_score", "total"),
+    },
+    "penalty": {
+        "scored": ("penalty", "scored"),
+        "missed": ("penalty", "missed"),
+        "total": ("penalty", "total"),
+    },
+    "lineups": ("lineups",),
+    "cards": {
+        color: {bucket: ("cards", color, bucket) for bucket in _CARD_BUCKETS}
+        for color in ("yellow", "red")
+    },
+}
+
+# Leaf paths of the statistics schema, in the order _render consumes them
+_STATS_LEAVES = _leaves(_STATS_SCHEMA)
+
+# Leading byte of cached statistics blobs; bump when _STATS_SCHEMA changes
+_STATS_CACHE_VERSION = b"\x01"
+
+
+def _format_stats(values: Iterable[Any]) -> dict[str, Any]:
+    """Build formatted team statistics from leaf values in _STATS_LEAVES order."""
+    formatted_stats = _render(_STATS_SCHEMA, iter(values))
+    if formatted_stats["lineups"] is None:
+        formatted_stats["lineups"] = []
+    return formatted_stats
+
+
+def _pack_stats(values: tuple[Any, ...], request_id: str) -> bytes:
+    """Encode statistics leaf values for the cache, without repeating the keys."""
+    return _STATS_CACHE_VERSION + orjson.dumps([request_id, values])
+
+
+def _unpack_stats(blob: Any) -> dict[str, Any] | None:
+    """Decode a cached statistics blob, or return None if it is missing or outdated."""
+    if not isinstance(blob, bytes) or not blob.startswith(_STATS_CACHE_VERSION):
+        return None
+    request_id, values = orjson.loads(blob[1:])
+    return {
+        "statistics": _format_stats(values),
+        "request_id": request_id,
+    }
+
+
+def _new_request_id() -> str:
+    """Return a request ID for log correlation, unique across processes."""
+    return f"{_PID}-{next(_REQUEST_IDS):x}"
+
 
 class RateLimiter:
-    """Rate limiter for API calls."""
+    """Sliding-window rate limiter for API calls.
+
+    Each window keeps the timestamps of its calls in arrival order, so expired
+    ones are dropped from the front; every timestamp is appended and popped
+    once, making acquire amortized O(1) while never exceeding a quota.
+    """
 
-    def __init__(self, calls_per_minute: int, calls_per_day: int, burst_size: int):
+    def __init__(
+        self,
+        calls_per_minute: int,
+        calls_per_day: int,
+        burst_size: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.calls_per_minute = calls_per_minute
         self.calls_per_day = calls_per_day
         self.burst_size = burst_size
+        self._clock = clock
 
-        self.minute_calls: list[float] = []
-        self.day_calls: list[float] = []
+        self.minute_calls: deque[float] = deque()
+        self.day_calls: deque[float] = deque()
         self.lock = asyncio.Lock()
 
+    def reset(self) -> None:
+        """Forget all recorded calls."""
+        self.minute_calls.clear()
+        self.day_calls.clear()
+
+    @staticmethod
+    def _prune(calls: deque[float], now: float, window: float) -> None:
+        """Drop calls that have left the window."""
+        while calls and now - calls[0] >= window:
+            calls.popleft()
+
     async def acquire(self) -> None:
         """Acquire permission to make an API call."""
         async with self.lock:
-            now = time.time()
-
-            # Clean up old calls
-            minute_ago = now - 60
-            day_ago = now - 86400
-
-            self.minute_calls = [t for t in self.minute_calls if t > minute_ago]
-            self.day_calls = [t for t in self.day_calls if t > day_ago]
-
-            # Check limits
-            if len(self.minute_calls) >= self.calls_per_minute:
-                sleep_time = 60 - (now - self.minute_calls[0])
-                logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
-                await asyncio.sleep(sleep_time)
-                return await self.acquire()
+            while True:
+                now = self._clock()
+                self._prune(self.minute_calls, now, 60)
+                self._prune(self.day_calls, now, 86400)
+
+                # Check limits
+                if len(self.minute_calls) >= self.calls_per_minute:
+                    sleep_time = 60 - (now - self.minute_calls[0])
+                    logger.warning(f"Rate limit reached, sleeping for {sleep_time:.2f}s")
+                    await asyncio.sleep(sleep_time)
+                    continue
 
-            if len(self.day_calls) >= self.calls_per_day:
-                sleep_time = 86400 - (now - self.day_calls[0])
-                logger.error(f"Daily limit reached, sleeping for {sleep_time:.2f}s")
-                await asyncio.sleep(sleep_time)
-                return await self.acquire()
+                if len(self.day_calls) >= self.calls_per_day:
+                    sleep_time = 86400 - (now - self.day_calls[0])
+                    logger.error(f"Daily limit reached, sleeping for {sleep_time:.2f}s")
+                    await asyncio.sleep(sleep_time)
+                    continue
 
-            # Record call
-            self.minute_calls.append(now)
-            self.day_calls.append(now)
+                # Record call
+                self.minute_calls.append(now)
+                self.day_calls.append(now)
+                return
 
     def get_remaining(self) -> dict[str, int]:
         """Get remaining API calls."""
-        now = time.time()
-        minute_ago = now - 60
-        day_ago = now - 86400
-
-        minute_calls = [t for t in self.minute_calls if t > minute_ago]
-        day_calls = [t for t in self.day_calls if t > day_ago]
+        now = self._clock()
+        self._prune(self.minute_calls, now, 60)
+        self._prune(self.day_calls, now, 86400)
 
         return {
-            "minute": max(0, self.calls_per_minute - len(minute_calls)),
-            "day": max(0, self.calls_per_day - len(day_calls)),
+            "minute": max(0, self.calls_per_minute - len(self.minute_calls)),
+            "day": max(0, self.calls_per_day - len(self.day_calls)),
         }
 
 
@@ -86,6 +294,10 @@ class ApiSportsService:
         self.api_key = self.settings.api_sports_api_key
         self.cache_service = cache_service
 
+        # Resolve log levels once, so hot paths can skip building log payloads
+        self._info = is_level_enabled("INFO")
+        self._dbg = is_level_enabled("DEBUG")
+
         self.rate_limiter = RateLimiter(
             calls_per_minute=self.settings.rate_limit_calls_per_minute,
             calls_per_day=self.settings.rate_limit_calls_per_day,
@@ -95,6 +307,13 @@ class ApiSportsService:
         self.client: httpx.AsyncClient | None = None
         self._client_lock = asyncio.Lock()
 
+        # Background stale-while-revalidate refreshes, keyed by cache key
+        self._revalidating: set[str] = set()
+        self._background_tasks: set[asyncio.Task[None]] = set()
+
+        # In-progress fetches shared by concurrent identical requests
+        self._inflight: dict[str, asyncio.Future[Any]] = {}
+
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self.client is None:
@@ -107,11 +326,16 @@ class ApiSportsService:
                             "X-RapidAPI-Host": "v3.football.api-sports.io",
                         },
                         timeout=httpx.Timeout(30.0),
+                        # Keep connections alive across bursts of related tool
+                        # calls, so they share TCP and TLS setup
+                        limits=httpx.Limits(keepalive_expiry=30.0),
                     )
         return self.client
 
     async def close(self) -> None:
         """Close HTTP client."""
+        for task in self._background_tasks:
+            task.cancel()
         if self.client:
             await self.client.aclose()
             self.client = None
@@ -203,9 +427,9 @@ class ApiSportsService:
                     )
                     raise httpx.HTTPStatusError(error_text, request=response.request, response=response)
 
-                # Parse response
-                data = response.json()
-                api_response = ApiResponse(**data)
+                # Parse and validate the body in a single pass, without an
+                # intermediate dict
+                api_response = ApiResponse.model_validate_json(response.content)
 
                 # Check for API errors in the response body
                 if api_response.errors:
@@ -264,11 +488,21 @@ class ApiSportsService:
                     raise
 
             except ValidationError as e:
-                logger.error(
-                    f"Response validation error: {e}",
-                    extra={"endpoint": endpoint, "request_id": request_id}
-                )
-                raise
+                # A truncated or malformed body is transient, like a dropped
+                # connection; only a well-formed body of the wrong shape is final
+                if any(err["type"] == "json_invalid" for err in e.errors()):
+                    logger.error(
+                        f"Invalid JSON body on attempt {attempt + 1}",
+                        extra={"error": str(e), "endpoint": endpoint, "request_id": request_id}
+                    )
+                    if attempt == max_retries - 1:
+                        raise
+                else:
+                    logger.error(
+                        "Response validation error",
+                        extra={"error": str(e), "endpoint": endpoint, "request_id": request_id}
+                    )
+                    raise
 
             except Exception as e:
                 logger.error(
@@ -506,6 +740,106 @@ class ApiSportsService:
 
     # Business logic methods with validation and formatting
 
+    def _revalidate(
+        self,
+        cache_key: str,
+        refresh: Callable[[], Awaitable[Any]],
+        request_id: str,
+    ) -> None:
+        """Refresh a stale cache entry in the background, at most once per key."""
+        if cache_key in self._revalidating:
+            return
+        self._revalidating.add(cache_key)
+
+        async def _run() -> None:
+            try:
+                await refresh()
+            except Exception as e:
+                err = str(e)
+                logger.warning(
+                    f"Background cache refresh failed: {err}",
+                    extra={"error": err, "request_id": request_id}
+                )
+            finally:
+                self._revalidating.discard(cache_key)
+
+        task = asyncio.create_task(_run())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _single_flight(
+        self,
+        key: str | None,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """Run fetch once per key, letting concurrent callers await the same result.
+
+        The fetch runs in its own task and every caller awaits it through a
+        shield, so a cancelled caller stops waiting without cancelling the
+        fetch the others share.
+        """
+        if key is None:
+            return await fetch()
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._end_flight, key))
+        return await asyncio.shield(task)
+
+    def _end_flight(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a finished shared fetch."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved in case every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_teams(
+        self,
+        query: dict[str, Any],
+        params: dict[str, Any],
+        cache_key: str | None,
+        request_id: str,
+    ) -> dict[str, Any]:
+        """Fetch teams from the API, format them and store the result in the cache."""
+        # Make API request
+        response = await self.get_teams(**query)
+
+        # Process response
+        teams_data = [
+            {
+                **{key: team_info.get(key) for key in _TEAM_KEYS},
+                "national": team_info.get("national", False),
+                "venue": (
+                    {key: venue_info.get(key) for key in _VENUE_KEYS}
+                    if venue_info else None
+                ),
+            }
+            for item in response.response
+            for team_info in (item.get("team") or _EMPTY,)
+            for venue_info in (item.get("venue") or _EMPTY,)
+        ]
+
+        count = len(teams_data)
+        result = {
+            "teams": teams_data,
+            "count": count,
+            "request_id": request_id,
+        }
+
+        # Cache result if cache service is available
+        if self.cache_service:
+            self.cache_service.set_teams(params, result, cache_key=cache_key)
+
+        logger.success(
+            f"Found {count} teams",
+            extra={"count": count, "request_id": request_id}
+        )
+
+        return result
+
     async def search_teams(
         self,
         id: int | None = None,
@@ -533,114 +867,68 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted team information
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         # Validate search parameter
         if search and len(search) < 3:
-            return {
-                "error": "Search parameter must be at least 3 characters long",
-                "request_id": request_id,
-            }
-
-        # Build parameters for cache key
-        params: dict[str, Any] = {}
-        if id is not None:
-            params["id"] = str(id)
-        if name:
-            params["name"] = name
-        if league is not None:
-            params["league"] = str(league)
-        if season is not None:
-            params["season"] = str(season)
-        if country:
-            params["country"] = country
-        if code:
-            params["code"] = code
-        if venue is not None:
-            params["venue"] = str(venue)
-        if search:
-            params["search"] = search
+            return _error(_SEARCH_TOO_SHORT_ERROR, request_id)
+
+        # Full argument set for the API call; the non-empty subset keys the cache
+        query: dict[str, Any] = {
+            "id": id,
+            "name": name,
+            "league": league,
+            "season": season,
+            "country": country,
+            "code": code,
+            "venue": venue,
+            "search": search,
+        }
+        params = {k: v for k, v in query.items() if v is not None and v != ""}
 
-        logger.info(
-            "Searching teams",
-            extra={"params": params, "request_id": request_id}
-        )
+        if self._info:
+            logger.info(
+                "Searching teams",
+                extra={"params": params, "request_id": request_id}
+            )
 
         try:
-            # Check cache first if cache service is available
+            # Check cache first if cache service is available; the key is
+            # computed once and reused when storing the result
+            cache_key = None
             if self.cache_service:
-                cached_result = await self.cache_service.get_teams(params)
+                cache_key = self.cache_service.teams_key(params)
+                cached_result, is_stale = self.cache_service.get_teams(
+                    params, cache_key=cache_key
+                )
                 if cached_result:
-                    logger.debug(
-                        "Returning cached teams result",
-                        extra={"request_id": request_id}
-                    )
+                    if is_stale:
+                        self._revalidate(
+                            cache_key,
+                            functools.partial(
+                                self._fetch_teams, query, params, cache_key, request_id
+                            ),
+                            request_id,
+                        )
+                    if self._dbg:
+                        logger.debug(
+                            "Returning cached teams result",
+                            extra={"request_id": request_id}
+                        )
                     return cached_result  # type: ignore[no-any-return]
 
-            # Make API request
-            response = await self.get_teams(
-                id=id,
-                name=name,
-                league=league,
-                season=season,
-                country=country,
-                code=code,
-                venue=venue,
-                search=search,
+            return await self._single_flight(  # type: ignore[no-any-return]
+                cache_key,
+                functools.partial(self._fetch_teams, query, params, cache_key, request_id),
             )
 
-            # Process response
-            teams_data = []
-            for item in response.response:
-                team_info = item.get("team", {})
-                venue_info = item.get("venue", {})
-
-                team_data = {
-                    "id": team_info.get("id"),
-                    "name": team_info.get("name"),
-                    "code": team_info.get("code"),
-                    "country": team_info.get("country"),
-                    "founded": team_info.get("founded"),
-                    "national": team_info.get("national", False),
-                    "logo": team_info.get("logo"),
-                    "venue": {
-                        "id": venue_info.get("id"),
-                        "name": venue_info.get("name"),
-                        "address": venue_info.get("address"),
-                        "city": venue_info.get("city"),
-                        "capacity": venue_info.get("capacity"),
-                        "surface": venue_info.get("surface"),
-                        "image": venue_info.get("image"),
-                    } if venue_info else None,
-                }
-                teams_data.append(team_data)
-
-            result = {
-                "teams": teams_data,
-                "count": len(teams_data),
-                "request_id": request_id,
-            }
-
-            # Cache result if cache service is available
-            if self.cache_service:
-                await self.cache_service.set_teams(params, result)
-
-            logger.success(
-                f"Found {len(teams_data)} teams",
-                extra={"count": len(teams_data), "request_id": request_id}
-            )
-
-            return result
-
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error searching teams: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error searching teams: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to search teams: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to search teams: {err}", request_id)
 
     async def search_fixtures(
         self,
@@ -666,101 +954,62 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted fixture information
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
+
+        # Build parameters once; used for both the cache key and the API call
+        params: dict[str, Any] = {
+            k: v for k, v in {
+                "id": id,
+                "ids": ids,
+                "live": live,
+                "date": date,
+                "league": league,
+                "season": season,
+                "team": team,
+                "last": last,
+                "next": next,
+                "from_date": from_date,
+                "to_date": to_date,
+                "round": round,
+                "status": status,
+                "venue": venue,
+                "timezone": timezone,
+            }.items()
+            if v is not None and v != ""
+        }
+
+        # Check cache before validating: only valid requests are ever cached,
+        # so a hit can be returned as is. Live fixtures are never cached.
+        if not live and self.cache_service:
+            cached_result = self.cache_service.get_fixtures(params)
+            if cached_result:
+                logger.debug(
+                    "Returning cached fixtures result",
+                    extra={"request_id": request_id}
+                )
+                return cached_result  # type: ignore[no-any-return]
 
         # Validate parameters
         if league is not None and season is None:
-            return {
-                "error": "When using 'league' parameter, 'season' is required",
-                "request_id": request_id,
-            }
+            return _error("When using 'league' parameter, 'season' is required", request_id)
             
         if team is not None and season is None:
-            return {
-                "error": "When using 'team' parameter, 'season' is required",
-                "request_id": request_id,
-            }
+            return _error("When using 'team' parameter, 'season' is required", request_id)
             
         if last and last > 99:
-            return {
-                "error": "Last parameter must be 2 digits or less",
-                "request_id": request_id,
-            }
+            return _error("Last parameter must be 2 digits or less", request_id)
 
         if next and next > 99:
-            return {
-                "error": "Next parameter must be 2 digits or less",
-                "request_id": request_id,
-            }
+            return _error("Next parameter must be 2 digits or less", request_id)
 
-        if date:
-            try:
-                datetime.strptime(date, "%Y-%m-%d")
-            except ValueError:
-                return {
-                    "error": "Date must be in YYYY-MM-DD format",
-                    "request_id": request_id,
-                }
-
-        if from_date:
-            try:
-                datetime.strptime(from_date, "%Y-%m-%d")
-            except ValueError:
-                return {
-                    "error": "From date must be in YYYY-MM-DD format",
-                    "request_id": request_id,
-                }
+        if date and not _is_valid_date(date):
+            return _error(_DATE_FORMAT_ERROR, request_id)
 
-        if to_date:
-            try:
-                datetime.strptime(to_date, "%Y-%m-%d")
-            except ValueError:
-                return {
-                    "error": "To date must be in YYYY-MM-DD format",
-                    "request_id": request_id,
-                }
+        if from_date and not _is_valid_date(from_date):
+            return _error("From date must be in YYYY-MM-DD format", request_id)
 
-        # Build parameters
-        params: dict[str, Any] = {}
-        if id is not None:
-            params["id"] = str(id)
-        if ids:
-            params["ids"] = ids
-        if live:
-            params["live"] = live
-        if date:
-            params["date"] = date
-        if league is not None:
-            params["league"] = str(league)
-        if season is not None:
-            params["season"] = str(season)
-        if team is not None:
-            params["team"] = str(team)
-            # If only team is provided without other filters, get next 10 fixtures
-            # This ensures we get meaningful results
-            if (season is None and not date and not from_date and
-                not last and not next and not id and not ids and not live):
-                params["next"] = "10"
-                logger.info(
-                    "Auto-adding next=10 for team-only query to get upcoming fixtures",
-                    extra={"team": team, "request_id": request_id}
-                )
-        if last is not None:
-            params["last"] = str(last)
-        if next is not None:
-            params["next"] = str(next)
-        if from_date:
-            params["from"] = from_date
-        if to_date:
-            params["to"] = to_date
-        if round:
-            params["round"] = round
-        if status:
-            params["status"] = status
-        if venue is not None:
-            params["venue"] = str(venue)
-        if timezone:
-            params["timezone"] = timezone
+        if to_date and not _is_valid_date(to_date):
+            return _error("To date must be in YYYY-MM-DD format", request_id)
 
         logger.info(
             "Retrieving fixtures",
@@ -768,43 +1017,26 @@ class ApiSportsService:
         )
 
         try:
-            # Don't cache live fixtures
-            if not live and self.cache_service:
-                cached_result = await self.cache_service.get_fixtures(params)
-                if cached_result:
-                    logger.debug(
-                        "Returning cached fixtures result",
-                        extra={"request_id": request_id}
-                    )
-                    return cached_result  # type: ignore[no-any-return]
-
             # Make API request
-            response = await self.get_fixtures(
-                id=id,
-                ids=ids,
-                live=live,
-                date=date,
-                league=league,
-                season=season,
-                team=team,
-                last=last,
-                next=next,
-                from_date=from_date,
-                to_date=to_date,
-                round=round,
-                status=status,
-                venue=venue,
-                timezone=timezone,
-            )
+            response = await self.get_fixtures(**params)
 
             # Process response
-            fixtures_data = []
+            fixtures_data: list[dict[str, Any]] = []
             for item in response.response:
-                fixture_info = item.get("fixture", {})
-                league_info = item.get("league", {})
-                teams_info = item.get("teams", {})
-                goals_info = item.get("goals", {})
-                score_info = item.get("score", {})
+                fixture_info = item.get("fixture") or _EMPTY
+                league_info = item.get("league") or _EMPTY
+                teams_info = item.get("teams") or _EMPTY
+                goals_info = item.get("goals") or _EMPTY
+                score_info = item.get("score") or _EMPTY
+
+                venue_info = fixture_info.get("venue")
+                status_info = fixture_info.get("status") or _EMPTY
+                home_info = teams_info.get("home") or _EMPTY
+                away_info = teams_info.get("away") or _EMPTY
+                halftime_info = score_info.get("halftime") or _EMPTY
+                fulltime_info = score_info.get("fulltime") or _EMPTY
+                extratime_info = score_info.get("extratime")
+                penalty_info = score_info.get("penalty")
 
                 fixture_data = {
                     "id": fixture_info.get("id"),
@@ -813,14 +1045,14 @@ class ApiSportsService:
                     "date": fixture_info.get("date"),
                     "timestamp": fixture_info.get("timestamp"),
                     "venue": {
-                        "id": fixture_info.get("venue", {}).get("id"),
-                        "name": fixture_info.get("venue", {}).get("name"),
-                        "city": fixture_info.get("venue", {}).get("city"),
-                    } if fixture_info.get("venue") else None,
+                        "id": venue_info.get("id"),
+                        "name": venue_info.get("name"),
+                        "city": venue_info.get("city"),
+                    } if venue_info else None,
                     "status": {
-                        "long": fixture_info.get("status", {}).get("long"),
-                        "short": fixture_info.get("status", {}).get("short"),
-                        "elapsed": fixture_info.get("status", {}).get("elapsed"),
+                        "long": status_info.get("long"),
+                        "short": status_info.get("short"),
+                        "elapsed": status_info.get("elapsed"),
                     },
                     "league": {
                         "id": league_info.get("id"),
@@ -833,16 +1065,16 @@ class ApiSportsService:
                     },
                     "teams": {
                         "home": {
-                            "id": teams_info.get("home", {}).get("id"),
-                            "name": teams_info.get("home", {}).get("name"),
-                            "logo": teams_info.get("home", {}).get("logo"),
-                            "winner": teams_info.get("home", {}).get("winner"),
+                            "id": home_info.get("id"),
+                            "name": home_info.get("name"),
+                            "logo": home_info.get("logo"),
+                            "winner": home_info.get("winner"),
                         },
                         "away": {
-                            "id": teams_info.get("away", {}).get("id"),
-                            "name": teams_info.get("away", {}).get("name"),
-                            "logo": teams_info.get("away", {}).get("logo"),
-                            "winner": teams_info.get("away", {}).get("winner"),
+                            "id": away_info.get("id"),
+                            "name": away_info.get("name"),
+                            "logo": away_info.get("logo"),
+                            "winner": away_info.get("winner"),
                         },
                     },
                     "goals": {
@@ -851,21 +1083,21 @@ class ApiSportsService:
                     },
                     "score": {
                         "halftime": {
-                            "home": score_info.get("halftime", {}).get("home"),
-                            "away": score_info.get("halftime", {}).get("away"),
+                            "home": halftime_info.get("home"),
+                            "away": halftime_info.get("away"),
                         },
                         "fulltime": {
-                            "home": score_info.get("fulltime", {}).get("home"),
-                            "away": score_info.get("fulltime", {}).get("away"),
+                            "home": fulltime_info.get("home"),
+                            "away": fulltime_info.get("away"),
                         },
                         "extratime": {
-                            "home": score_info.get("extratime", {}).get("home"),
-                            "away": score_info.get("extratime", {}).get("away"),
-                        } if score_info.get("extratime") else None,
+                            "home": extratime_info.get("home"),
+                            "away": extratime_info.get("away"),
+                        } if extratime_info else None,
                         "penalty": {
-                            "home": score_info.get("penalty", {}).get("home"),
-                            "away": score_info.get("penalty", {}).get("away"),
-                        } if score_info.get("penalty") else None,
+                            "home": penalty_info.get("home"),
+                            "away": penalty_info.get("away"),
+                        } if penalty_info else None,
                     },
                 }
                 fixtures_data.append(fixture_data)
@@ -879,12 +1111,11 @@ class ApiSportsService:
             # Cache result if not live and cache service is available
             if not live and fixtures_data and self.cache_service:
                 # Check if all fixtures are completed to determine cache type
-                completed_statuses = ["FT", "AET", "PEN", "PST", "CANC", "ABD", "AWD", "WO"]
                 all_completed = all(
-                    f["status"]["short"] in completed_statuses
+                    f["status"]["short"] in _COMPLETED_STATUSES
                     for f in fixtures_data
                 )
-                await self.cache_service.set_fixtures(params, result, is_completed=all_completed)
+                self.cache_service.set_fixtures(params, result, is_completed=all_completed)
 
             logger.success(
                 f"Found {len(fixtures_data)} fixtures",
@@ -894,14 +1125,59 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving fixtures: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving fixtures: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve fixtures: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve fixtures: {err}", request_id)
+
+    async def _fetch_team_statistics(
+        self,
+        league: int,
+        season: int,
+        team: int,
+        date: str | None,
+        params: dict[str, Any],
+        cache_key: str | None,
+        request_id: str,
+    ) -> dict[str, Any]:
+        """Fetch team statistics from the API, format them and store the result in the cache."""
+        # Make API request
+        response = await self.get_team_statistics(
+            league=league,
+            season=season,
+            team=team,
+            date=date,
+        )
+
+        # Process response
+        if not response.response:
+            return _error("No statistics found for the specified parameters", request_id)
+
+        stats_data = response.response[0]
+
+        # Extract the schema's leaf values once; they build both the
+        # formatted result and the compact cached form
+        values = tuple(_dig(stats_data, path) for path in _STATS_LEAVES)
+
+        result = {
+            "statistics": _format_stats(values),
+            "request_id": request_id,
+        }
+
+        # Cache result if cache service is available
+        if self.cache_service:
+            self.cache_service.set_statistics(
+                params, _pack_stats(values, request_id), cache_key=cache_key
+            )
+
+        logger.success(
+            "Retrieved team statistics successfully",
+            extra={"request_id": request_id}
+        )
+
+        return result
 
     async def get_team_statistics_formatted(
         self,
@@ -916,100 +1192,71 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted team statistics
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         # Validate date format if provided
-        if date:
-            try:
-                datetime.strptime(date, "%Y-%m-%d")
-            except ValueError:
-                return {
-                    "error": "Date must be in YYYY-MM-DD format",
-                    "request_id": request_id,
-                }
+        if date and not _is_valid_date(date):
+            return _error(_DATE_FORMAT_ERROR, request_id)
 
         # Build parameters
         params: dict[str, Any] = {
-            "league": str(league),
-            "season": str(season),
-            "team": str(team),
+            k: v for k, v in {
+                "league": league,
+                "season": season,
+                "team": team,
+                "date": date,
+            }.items()
+            if v is not None and v != ""
         }
-        if date:
-            params["date"] = date
 
-        logger.info(
-            "Retrieving team statistics",
-            extra={"params": params, "request_id": request_id}
-        )
+        if self._info:
+            logger.info(
+                "Retrieving team statistics",
+                extra={"params": params, "request_id": request_id}
+            )
 
         try:
-            # Check cache first if cache service is available
+            # Check cache first if cache service is available; the key is
+            # computed once and reused when storing the result
+            cache_key = None
             if self.cache_service:
-                cached_result = await self.cache_service.get_statistics(params)
+                cache_key = self.cache_service.statistics_key(params)
+                cached_blob, is_stale = self.cache_service.get_statistics(
+                    params, cache_key=cache_key
+                )
+                cached_result = _unpack_stats(cached_blob)
                 if cached_result:
-                    logger.debug(
-                        "Returning cached statistics result",
-                        extra={"request_id": request_id}
-                    )
-                    return cached_result  # type: ignore[no-any-return]
-
-            # Make API request
-            response = await self.get_team_statistics(
-                league=league,
-                season=season,
-                team=team,
-                date=date,
-            )
-
-            # Process response
-            if not response.response:
-                return {
-                    "error": "No statistics found for the specified parameters",
-                    "request_id": request_id,
-                }
-
-            stats_data = response.response[0]
-
-            # Extract and format statistics (simplified version)
-            formatted_stats = {
-                "league": stats_data.get("league", {}),
-                "team": stats_data.get("team", {}),
-                "form": stats_data.get("form"),
-                "fixtures": stats_data.get("fixtures", {}),
-                "goals": stats_data.get("goals", {}),
-                "biggest": stats_data.get("biggest", {}),
-                "clean_sheet": stats_data.get("clean_sheet", {}),
-                "failed_to_score": stats_data.get("failed_to_score", {}),
-                "penalty": stats_data.get("penalty", {}),
-                "lineups": stats_data.get("lineups", []),
-                "cards": stats_data.get("cards", {}),
-            }
-
-            result = {
-                "statistics": formatted_stats,
-                "request_id": request_id,
-            }
-
-            # Cache result if cache service is available
-            if self.cache_service:
-                await self.cache_service.set_statistics(params, result)
-
-            logger.success(
-                "Retrieved team statistics successfully",
-                extra={"request_id": request_id}
+                    if is_stale:
+                        self._revalidate(
+                            cache_key,
+                            functools.partial(
+                                self._fetch_team_statistics,
+                                league, season, team, date, params, cache_key, request_id,
+                            ),
+                            request_id,
+                        )
+                    if self._dbg:
+                        logger.debug(
+                            "Returning cached statistics result",
+                            extra={"request_id": request_id}
+                        )
+                    return cached_result
+
+            return await self._single_flight(  # type: ignore[no-any-return]
+                cache_key,
+                functools.partial(
+                    self._fetch_team_statistics,
+                    league, season, team, date, params, cache_key, request_id,
+                ),
             )
 
-            return result
-
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving team statistics: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving team statistics: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve team statistics: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve team statistics: {err}", request_id)
 
     async def get_standings_formatted(
         self,
@@ -1023,7 +1270,7 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted standings information
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         logger.info(
             "Retrieving standings",
@@ -1034,7 +1281,7 @@ class ApiSportsService:
             # Check cache first if cache service is available
             cache_key = f"standings:{league}:{season}:{team or 'all'}"
             if self.cache_service:
-                cached_result = await self.cache_service.get(cache_key)
+                cached_result = self.cache_service.get(cache_key)
                 if cached_result:
                     logger.debug(
                         "Returning cached standings result",
@@ -1051,10 +1298,7 @@ class ApiSportsService:
 
             # Process response
             if not response.response or not response.response[0]:
-                return {
-                    "error": "No standings found for the specified parameters",
-                    "request_id": request_id,
-                }
+                return _error("No standings found for the specified parameters", request_id)
 
             standings_data = []
             league_info = response.response[0].get("league", {})
@@ -1098,7 +1342,7 @@ class ApiSportsService:
 
             # Cache result if cache service is available (30 minutes TTL)
             if self.cache_service:
-                await self.cache_service.set(cache_key, result, "standings")
+                self.cache_service.set(cache_key, result, "standings")
 
             logger.success(
                 f"Retrieved standings for {len(standings_data)} teams",
@@ -1108,14 +1352,12 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving standings: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving standings: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve standings: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve standings: {err}", request_id)
 
     async def get_head2head_formatted(
         self,
@@ -1140,14 +1382,14 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted head-to-head fixtures
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         # Validate h2h format
         if not h2h or '-' not in h2h:
-            return {
-                "error": "h2h parameter must be in format 'team1-team2' (e.g., '33-34')",
-                "request_id": request_id,
-            }
+            return _error(
+                "h2h parameter must be in format 'team1-team2' (e.g., '33-34')",
+                request_id,
+            )
 
         # Validate dates if provided
         for date_param, date_value in [("date", date), ("from_date", from_date), ("to_date", to_date)]:
@@ -1155,10 +1397,7 @@ class ApiSportsService:
                 try:
                     datetime.strptime(date_value, "%Y-%m-%d")
                 except ValueError:
-                    return {
-                        "error": f"{date_param} must be in YYYY-MM-DD format",
-                        "request_id": request_id,
-                    }
+                    return _error(f"{date_param} must be in YYYY-MM-DD format", request_id)
 
         logger.info(
             "Retrieving head-to-head fixtures",
@@ -1252,14 +1491,12 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving head-to-head fixtures: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving head-to-head fixtures: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve head-to-head fixtures: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve head-to-head fixtures: {err}", request_id)
 
     async def get_fixture_statistics_formatted(self, fixture: int) -> dict[str, Any]:
         """
@@ -1268,7 +1505,7 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted fixture statistics
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         logger.info(
             "Retrieving fixture statistics",
@@ -1279,7 +1516,7 @@ class ApiSportsService:
             # Check cache first if cache service is available
             cache_key = f"fixture_stats:{fixture}"
             if self.cache_service:
-                cached_result = await self.cache_service.get(cache_key)
+                cached_result = self.cache_service.get(cache_key)
                 if cached_result:
                     logger.debug(
                         "Returning cached fixture statistics",
@@ -1292,10 +1529,7 @@ class ApiSportsService:
 
             # Process response
             if not response.response:
-                return {
-                    "error": "No statistics found for this fixture",
-                    "request_id": request_id,
-                }
+                return _error("No statistics found for this fixture", request_id)
 
             stats_data = []
             for team_stats in response.response:
@@ -1322,7 +1556,7 @@ class ApiSportsService:
 
             # Cache result if cache service is available (completed fixtures cache forever)
             if self.cache_service:
-                await self.cache_service.set(cache_key, result, "fixtures_completed")
+                self.cache_service.set(cache_key, result, "fixtures_completed")
 
             logger.success(
                 "Retrieved fixture statistics successfully",
@@ -1332,14 +1566,12 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving fixture statistics: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving fixture statistics: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve fixture statistics: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve fixture statistics: {err}", request_id)
 
     async def get_fixture_events_formatted(self, fixture: int) -> dict[str, Any]:
         """
@@ -1348,7 +1580,7 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted fixture events
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         logger.info(
             "Retrieving fixture events",
@@ -1359,7 +1591,7 @@ class ApiSportsService:
             # Check cache first if cache service is available
             cache_key = f"fixture_events:{fixture}"
             if self.cache_service:
-                cached_result = await self.cache_service.get(cache_key)
+                cached_result = self.cache_service.get(cache_key)
                 if cached_result:
                     logger.debug(
                         "Returning cached fixture events",
@@ -1396,7 +1628,7 @@ class ApiSportsService:
 
             # Cache result if cache service is available (completed fixtures cache forever)
             if self.cache_service:
-                await self.cache_service.set(cache_key, result, "fixtures_completed")
+                self.cache_service.set(cache_key, result, "fixtures_completed")
 
             logger.success(
                 f"Retrieved {len(events_data)} events for fixture",
@@ -1406,14 +1638,12 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving fixture events: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving fixture events: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve fixture events: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve fixture events: {err}", request_id)
 
     async def get_fixture_lineups_formatted(self, fixture: int) -> dict[str, Any]:
         """
@@ -1422,7 +1652,7 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted fixture lineups
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         logger.info(
             "Retrieving fixture lineups",
@@ -1433,7 +1663,7 @@ class ApiSportsService:
             # Check cache first if cache service is available
             cache_key = f"fixture_lineups:{fixture}"
             if self.cache_service:
-                cached_result = await self.cache_service.get(cache_key)
+                cached_result = self.cache_service.get(cache_key)
                 if cached_result:
                     logger.debug(
                         "Returning cached fixture lineups",
@@ -1446,10 +1676,7 @@ class ApiSportsService:
 
             # Process response
             if not response.response:
-                return {
-                    "error": "No lineups found for this fixture",
-                    "request_id": request_id,
-                }
+                return _error("No lineups found for this fixture", request_id)
 
             lineups_data = []
             for team_lineup in response.response:
@@ -1486,7 +1713,7 @@ class ApiSportsService:
 
             # Cache result if cache service is available
             if self.cache_service:
-                await self.cache_service.set(cache_key, result, "fixtures_upcoming")
+                self.cache_service.set(cache_key, result, "fixtures_upcoming")
 
             logger.success(
                 "Retrieved fixture lineups successfully",
@@ -1496,14 +1723,12 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving fixture lineups: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving fixture lineups: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve fixture lineups: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve fixture lineups: {err}", request_id)
 
     async def get_predictions_formatted(self, fixture: int) -> dict[str, Any]:
         """
@@ -1512,7 +1737,7 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted fixture predictions
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         logger.info(
             "Retrieving fixture predictions",
@@ -1523,7 +1748,7 @@ class ApiSportsService:
             # Check cache first if cache service is available
             cache_key = f"predictions:{fixture}"
             if self.cache_service:
-                cached_result = await self.cache_service.get(cache_key)
+                cached_result = self.cache_service.get(cache_key)
                 if cached_result:
                     logger.debug(
                         "Returning cached predictions",
@@ -1536,10 +1761,7 @@ class ApiSportsService:
 
             # Process response
             if not response.response or not response.response[0]:
-                return {
-                    "error": "No predictions found for this fixture",
-                    "request_id": request_id,
-                }
+                return _error("No predictions found for this fixture", request_id)
 
             prediction_data = response.response[0]
 
@@ -1565,7 +1787,7 @@ class ApiSportsService:
 
             # Cache result if cache service is available (1 hour TTL)
             if self.cache_service:
-                await self.cache_service.set(cache_key, result, "predictions")
+                self.cache_service.set(cache_key, result, "predictions")
 
             logger.success(
                 "Retrieved fixture predictions successfully",
@@ -1575,14 +1797,12 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving predictions: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving predictions: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve predictions: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve predictions: {err}", request_id)
 
     async def search_leagues(
         self,
@@ -1615,35 +1835,23 @@ class ApiSportsService:
         Returns:
             Dictionary containing formatted league information
         """
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
 
         # Validate search parameter
         if search and len(search) < 3:
-            return {
-                "error": "Search parameter must be at least 3 characters long",
-                "request_id": request_id,
-            }
+            return _error(_SEARCH_TOO_SHORT_ERROR, request_id)
 
         # Validate type parameter
         if type and type not in ["league", "cup"]:
-            return {
-                "error": "Type parameter must be 'league' or 'cup'",
-                "request_id": request_id,
-            }
+            return _error("Type parameter must be 'league' or 'cup'", request_id)
 
         # Validate current parameter
         if current and current not in ["true", "false"]:
-            return {
-                "error": "Current parameter must be 'true' or 'false'",
-                "request_id": request_id,
-            }
+            return _error("Current parameter must be 'true' or 'false'", request_id)
 
         # Validate last parameter
         if last is not None and (last < 1 or last > 99):
-            return {
-                "error": "Last parameter must be between 1 and 99",
-                "request_id": request_id,
-            }
+            return _error("Last parameter must be between 1 and 99", request_id)
 
         # Build parameters for cache key
         params: dict[str, Any] = {}
@@ -1710,18 +1918,16 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving leagues: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving leagues: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve leagues: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve leagues: {err}", request_id)
 
     async def get_seasons_formatted(self) -> dict[str, Any]:
         """Get available seasons with formatted output."""
-        request_id = str(uuid.uuid4())
+        request_id = _new_request_id()
         
         logger.info(
             "Getting available seasons",
@@ -1754,11 +1960,9 @@ class ApiSportsService:
             return result
 
         except Exception as e:
+            err = str(e)
             logger.error(
-                f"Error retrieving seasons: {str(e)}",
-                extra={"error": str(e), "request_id": request_id}
+                f"Error retrieving seasons: {err}",
+                extra={"error": err, "request_id": request_id}
             )
-            return {
-                "error": f"Failed to retrieve seasons: {str(e)}",
-                "request_id": request_id,
-            }
+            return _error(f"Failed to retrieve seasons: {err}", request_id)
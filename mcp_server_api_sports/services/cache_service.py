@@ -1,176 +1,345 @@
 """Cache service for API-Sports MCP Server."""
 
-import asyncio
 import hashlib
-import json
+import heapq
+import random
+import threading
 import time
-from collections import OrderedDict
+from collections.abc import Callable
 from typing import Any
 
+import orjson
+
 from ..config import get_settings
-from ..logger import get_logger
+from ..logger import get_logger, is_level_enabled
 
 logger = get_logger(__name__)
 
+# Number of entries sampled when choosing an eviction victim
+_EVICTION_SAMPLE_SIZE = 5
+
+# Fraction of the TTL after which an entry is served stale and revalidated
+_STALE_AFTER = 0.8
+
 
 class CacheEntry:
     """Cache entry with TTL support."""
 
-    def __init__(self, value: Any, ttl: int):
-        self.value = value
-        self.expires_at = time.time() + ttl if ttl > 0 else float('inf')
+    __slots__ = ("value", "created_at", "expires_at", "stale_at", "accessed", "pos")
 
-    def is_expired(self) -> bool:
+    def __init__(self, value: Any, ttl: int, now: float):
+        self.value = value
+        self.created_at = now
+        if ttl > 0:
+            self.expires_at = self.created_at + ttl
+            self.stale_at = self.created_at + ttl * _STALE_AFTER
+        else:
+            self.expires_at = self.stale_at = float('inf')
+        # Reference bit for sampled eviction, set on every hit
+        self.accessed = False
+        # Index of the key in CacheService._keys, assigned on insert
+        self.pos = 0
+
+    def is_expired(self, now: float) -> bool:
         """Check if cache entry is expired."""
-        return time.time() > self.expires_at
+        return now > self.expires_at
+
+    def is_stale(self, now: float) -> bool:
+        """Check if cache entry is close enough to expiry to be revalidated."""
+        return now > self.stale_at
 
 
 class CacheService:
-    """In-memory cache service with TTL and LRU eviction."""
+    """In-memory cache service with TTL and sampled approximate-LRU eviction."""
 
-    def __init__(self) -> None:
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
         self.settings = get_settings()
+        # Time source for entry ages and expiry; tests inject a fake one
+        self._clock = clock
         self.enabled = self.settings.cache_enabled
         self.max_size = self.settings.cache_max_size
 
-        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self.lock = asyncio.Lock()
+        # Debug logging is off in production; skip building the messages
+        self._dbg = is_level_enabled("DEBUG")
+
+        # TTL per cache type, resolved once instead of on every set
+        self._ttl_map: dict[str, int] = {
+            "teams": self.settings.cache_ttl_teams,
+            "fixtures_completed": self.settings.cache_ttl_fixtures_completed,
+            "fixtures_upcoming": self.settings.cache_ttl_fixtures_upcoming,
+            "statistics": self.settings.cache_ttl_statistics,
+            "standings": self.settings.cache_ttl_standings,
+            "predictions": self.settings.cache_ttl_predictions,
+        }
+
+        # Mutated only under the lock; hits read it without locking and just
+        # set the entry's reference bit. No critical section does I/O, so a
+        # plain threading lock is enough and the methods stay synchronous.
+        self.cache: dict[str, CacheEntry] = {}
+        self.lock = threading.Lock()
+
+        # Live keys in no particular order, so eviction can sample random
+        # indexes without copying the key set. Each entry records its own
+        # position, and removal swaps the last key into the freed slot.
+        self._keys: list[str] = []
+
+        # Min-heap of (expires_at, key) for entries with a finite TTL. Stale
+        # pairs left by overwrites, evictions and invalidation are skipped
+        # when popped, and the heap is rebuilt from live entries once they
+        # make up more than half of it.
+        self._exp_heap: list[tuple[float, str]] = []
+
+        # Keys grouped by namespace ("teams:", "fixtures:", ...) so a namespace
+        # can be invalidated without scanning the whole cache
+        self._by_prefix: dict[str, set[str]] = {}
 
         # Statistics
         self.hits = 0
         self.misses = 0
         self.evictions = 0
 
+        # Last get_stats() result and the counters it was computed from
+        self._stats: dict[str, Any] | None = None
+        self._stats_state: tuple[Any, ...] = ()
+
     def _generate_key(self, prefix: str, params: dict[str, Any]) -> str:
         """Generate cache key from prefix and parameters."""
         # Sort params for consistent key generation
-        sorted_params = json.dumps(params, sort_keys=True)
-        hash_digest = hashlib.md5(sorted_params.encode()).hexdigest()
+        sorted_params = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        hash_digest = hashlib.blake2b(sorted_params, digest_size=16).hexdigest()
         return f"{prefix}:{hash_digest}"
 
+    @staticmethod
+    def _prefix(key: str) -> str:
+        """Return the namespace prefix of a key, including the colon."""
+        return key.split(":", 1)[0] + ":"
+
+    def _unindex(self, key: str) -> None:
+        """Drop a removed key from the prefix index. Must be called with the lock held."""
+        keys = self._by_prefix.get(self._prefix(key))
+        if keys is not None:
+            keys.discard(key)
+
+    def _forget(self, key: str) -> CacheEntry:
+        """Remove a key from the cache and the key list. Must be called with the lock held."""
+        entry = self.cache.pop(key)
+        last = self._keys.pop()
+        if last != key:
+            self._keys[entry.pos] = last
+            self.cache[last].pos = entry.pos
+        return entry
+
+    def _remove(self, key: str) -> None:
+        """Remove a key and drop it from the prefix index. Must be called with the lock held."""
+        self._forget(key)
+        self._unindex(key)
+
+    def _compact_exp_heap(self) -> None:
+        """Rebuild the expiry heap from live entries. Must be called with the lock held."""
+        heap = [
+            (entry.expires_at, key) for key, entry in self.cache.items()
+            if entry.expires_at != float('inf')
+        ]
+        heapq.heapify(heap)
+        self._exp_heap = heap
+
     def _get_ttl(self, cache_type: str) -> int:
         """Get TTL for specific cache type."""
-        ttl_map = {
-            "teams": self.settings.cache_ttl_teams,
-            "fixtures_completed": self.settings.cache_ttl_fixtures_completed,
-            "fixtures_upcoming": self.settings.cache_ttl_fixtures_upcoming,
-            "statistics": self.settings.cache_ttl_statistics,
-            "standings": self.settings.cache_ttl_standings,
-            "predictions": self.settings.cache_ttl_predictions,
-        }
-        return ttl_map.get(cache_type, 3600)  # Default 1 hour
-
-    async def get(self, key: str) -> Any | None:
+        return self._ttl_map.get(cache_type, 3600)  # Default 1 hour
+
+    def _evict_one(self) -> str:
+        """Evict an entry chosen from a random sample. Must be called with the lock held.
+
+        Prefers the oldest entry not accessed since it was last sampled; sampled
+        entries lose their reference bit, so hot keys get a second chance.
+        """
+        keys = self._keys
+        picks = random.sample(range(len(keys)), min(_EVICTION_SAMPLE_SIZE, len(keys)))
+        sample = [keys[i] for i in picks]
+        candidates = [k for k in sample if not self.cache[k].accessed] or sample
+        victim = min(candidates, key=lambda k: self.cache[k].created_at)
+        for key in sample:
+            self.cache[key].accessed = False
+        self._remove(victim)
+        return victim
+
+    def get(self, key: str) -> Any | None:
         """Get value from cache."""
+        entry = self._get_entry(key)
+        return entry.value if entry is not None else None
+
+    def get_with_staleness(self, key: str) -> tuple[Any | None, bool]:
+        """Get value from cache together with whether it should be revalidated."""
+        entry = self._get_entry(key)
+        if entry is None:
+            return None, False
+        return entry.value, entry.is_stale(self._clock())
+
+    def _get_entry(self, key: str) -> CacheEntry | None:
+        """Look up a live entry, recording the hit or miss."""
         if not self.enabled:
             return None
 
-        async with self.lock:
-            if key in self.cache:
-                entry = self.cache[key]
-
-                if entry.is_expired():
-                    # Remove expired entry
-                    del self.cache[key]
-                    self.misses += 1
-                    logger.debug(f"Cache miss (expired): {key}")
-                    return None
-
-                # Move to end (LRU)
-                self.cache.move_to_end(key)
-                self.hits += 1
-
-                logger.debug(
-                    f"Cache hit: {key}",
-                    extra={"hit_rate": self.get_hit_rate()}
-                )
-                return entry.value
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            if self._dbg:
+                logger.debug(f"Cache miss: {key}")
+            return None
 
+        if entry.is_expired(self._clock()):
+            # Remove expired entry unless it was replaced in the meantime
+            with self.lock:
+                if self.cache.get(key) is entry:
+                    self._remove(key)
             self.misses += 1
-            logger.debug(f"Cache miss: {key}")
+            if self._dbg:
+                logger.debug(f"Cache miss (expired): {key}")
             return None
 
-    async def set(self, key: str, value: Any, cache_type: str) -> None:
+        entry.accessed = True
+        self.hits += 1
+
+        if self._dbg:
+            logger.debug(
+                f"Cache hit: {key}",
+                extra={"hit_rate": self.get_hit_rate()}
+            )
+        return entry
+
+    def set(self, key: str, value: Any, cache_type: str) -> None:
         """Set value in cache with TTL based on type."""
         if not self.enabled:
             return
 
         ttl = self._get_ttl(cache_type)
 
-        async with self.lock:
-            # Remove if exists to update position
+        with self.lock:
+            # Replacing an existing key never needs an eviction
             if key in self.cache:
-                del self.cache[key]
+                self._forget(key)
 
             # Check size limit
             while len(self.cache) >= self.max_size:
-                # Evict least recently used
-                evicted_key = next(iter(self.cache))
-                del self.cache[evicted_key]
+                evicted_key = self._evict_one()
                 self.evictions += 1
-                logger.debug(f"Cache eviction: {evicted_key}")
+                if self._dbg:
+                    logger.debug(f"Cache eviction: {evicted_key}")
 
             # Add new entry
-            self.cache[key] = CacheEntry(value, ttl)
-            logger.debug(
-                f"Cache set: {key}",
-                extra={
-                    "ttl": ttl,
-                    "cache_size": len(self.cache),
-                    "cache_type": cache_type,
-                }
-            )
+            entry = CacheEntry(value, ttl, self._clock())
+            entry.pos = len(self._keys)
+            self.cache[key] = entry
+            self._keys.append(key)
+            self._by_prefix.setdefault(self._prefix(key), set()).add(key)
+            if entry.expires_at != float('inf'):
+                heapq.heappush(self._exp_heap, (entry.expires_at, key))
+                if len(self._exp_heap) > 2 * len(self.cache):
+                    self._compact_exp_heap()
+            if self._dbg:
+                logger.debug(
+                    f"Cache set: {key}",
+                    extra={
+                        "ttl": ttl,
+                        "cache_size": len(self.cache),
+                        "cache_type": cache_type,
+                    }
+                )
+
+    def invalidate(self, pattern: str | None = None) -> int:
+        """Invalidate cache entries matching pattern or all if pattern is None.
 
-    async def invalidate(self, pattern: str | None = None) -> int:
-        """Invalidate cache entries matching pattern or all if pattern is None."""
+        A pattern naming a whole namespace, such as "teams:", removes that
+        namespace's keys directly; any other pattern matches as a substring.
+        """
         if not self.enabled:
             return 0
 
-        async with self.lock:
+        with self.lock:
             if pattern is None:
                 # Clear all
                 count = len(self.cache)
                 self.cache.clear()
+                self._keys.clear()
+                self._exp_heap.clear()
+                self._by_prefix.clear()
                 logger.info(f"Cache cleared: {count} entries")
                 return count
 
-            # Remove entries matching pattern
-            keys_to_remove = [
-                key for key in self.cache
-                if pattern in key
-            ]
-
-            for key in keys_to_remove:
-                del self.cache[key]
-
-            logger.info(f"Cache invalidated: {len(keys_to_remove)} entries matching '{pattern}'")
-            return len(keys_to_remove)
-
-    async def cleanup_expired(self) -> int:
+            keys = self._by_prefix.get(pattern)
+            if keys is not None:
+                # Whole namespace: only its own keys are touched
+                count = len(keys)
+                for key in keys:
+                    self._forget(key)
+                keys.clear()
+            else:
+                # Arbitrary substring: rebuild with the survivors in a single pass
+                size_before = len(self.cache)
+                self.cache = {
+                    key: entry for key, entry in self.cache.items()
+                    if pattern not in key
+                }
+                count = size_before - len(self.cache)
+                self._keys = list(self.cache)
+                for pos, entry in enumerate(self.cache.values()):
+                    entry.pos = pos
+                for keys in self._by_prefix.values():
+                    keys.intersection_update(self.cache)
+
+            logger.info(f"Cache invalidated: {count} entries matching '{pattern}'")
+            return count
+
+    def reset(self) -> None:
+        """Drop all entries and statistics and restore the configured size limit."""
+        with self.lock:
+            self.cache.clear()
+            self._keys.clear()
+            self._exp_heap.clear()
+            self._by_prefix.clear()
+            self.hits = self.misses = self.evictions = 0
+            self._stats = None
+            self._stats_state = ()
+            self.max_size = self.settings.cache_max_size
+
+    def cleanup_expired(self) -> int:
         """Remove expired entries from cache."""
         if not self.enabled:
             return 0
 
-        async with self.lock:
-            keys_to_remove = [
-                key for key, entry in self.cache.items()
-                if entry.is_expired()
-            ]
+        with self.lock:
+            now = self._clock()
+            heap = self._exp_heap
+            count = 0
 
-            for key in keys_to_remove:
-                del self.cache[key]
+            # Only the expired prefix of the heap is visited
+            while heap and heap[0][0] < now:
+                expires_at, key = heapq.heappop(heap)
+                entry = self.cache.get(key)
+                # Skip keys that were removed or overwritten since this push
+                if entry is not None and entry.expires_at == expires_at:
+                    self._remove(key)
+                    count += 1
 
-            if keys_to_remove:
-                logger.debug(f"Cleaned up {len(keys_to_remove)} expired cache entries")
+            if count and self._dbg:
+                logger.debug(f"Cleaned up {count} expired cache entries")
 
-            return len(keys_to_remove)
+            return count
 
     def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
+        """Get cache statistics.
+
+        The returned dict is shared between calls while the counters are
+        unchanged and must not be mutated.
+        """
+        state = (self.enabled, len(self.cache), self.max_size, self.hits, self.misses, self.evictions)
+        if state == self._stats_state and self._stats is not None:
+            return self._stats
+
         total_requests = self.hits + self.misses
         hit_rate = (self.hits / total_requests * 100) if total_requests > 0 else 0
 
-        return {
+        self._stats = {
             "enabled": self.enabled,
             "size": len(self.cache),
             "max_size": self.max_size,
@@ -180,6 +349,8 @@ class CacheService:
             "hit_rate": f"{hit_rate:.2f}%",
             "total_requests": total_requests,
         }
+        self._stats_state = state
+        return self._stats
 
     def get_hit_rate(self) -> float:
         """Get cache hit rate as percentage."""
@@ -188,53 +359,74 @@ class CacheService:
 
     # Convenience methods for specific cache types
 
-    async def get_teams(self, params: dict[str, Any]) -> Any | None:
-        """Get teams from cache."""
-        key = self._generate_key("teams", params)
-        return await self.get(key)
-
-    async def set_teams(self, params: dict[str, Any], value: Any) -> None:
-        """Set teams in cache."""
-        key = self._generate_key("teams", params)
-        await self.set(key, value, "teams")
-
-    async def get_fixtures(self, params: dict[str, Any], is_completed: bool = False) -> Any | None:
+    def teams_key(self, params: dict[str, Any]) -> str:
+        """Generate the teams cache key, so callers can reuse it for get and set."""
+        return self._generate_key("teams", params)
+
+    def get_teams(
+        self, params: dict[str, Any], cache_key: str | None = None
+    ) -> tuple[Any | None, bool]:
+        """Get teams from cache as (value, is_stale), using cache_key verbatim if given."""
+        key = cache_key or self._generate_key("teams", params)
+        return self.get_with_staleness(key)
+
+    def set_teams(self, params: dict[str, Any], value: Any, cache_key: str | None = None) -> None:
+        """Set teams in cache, using cache_key verbatim if given."""
+        key = cache_key or self._generate_key("teams", params)
+        self.set(key, value, "teams")
+
+    def _fixtures_key(self, params: dict[str, Any]) -> str:
+        """Generate fixtures cache key, using the fixture ID(s) directly for ID lookups."""
+        if len(params) == 1:
+            if "id" in params:
+                return f"fixtures:id:{params['id']}"
+            if "ids" in params:
+                return f"fixtures:ids:{params['ids']}"
+        return self._generate_key("fixtures", params)
+
+    def get_fixtures(self, params: dict[str, Any], is_completed: bool = False) -> Any | None:
         """Get fixtures from cache."""
-        key = self._generate_key("fixtures", params)
-        return await self.get(key)
+        key = self._fixtures_key(params)
+        return self.get(key)
 
-    async def set_fixtures(self, params: dict[str, Any], value: Any, is_completed: bool = False) -> None:
+    def set_fixtures(self, params: dict[str, Any], value: Any, is_completed: bool = False) -> None:
         """Set fixtures in cache."""
-        key = self._generate_key("fixtures", params)
+        key = self._fixtures_key(params)
         cache_type = "fixtures_completed" if is_completed else "fixtures_upcoming"
-        await self.set(key, value, cache_type)
+        self.set(key, value, cache_type)
+
+    def statistics_key(self, params: dict[str, Any]) -> str:
+        """Generate the statistics cache key, so callers can reuse it for get and set."""
+        return self._generate_key("statistics", params)
 
-    async def get_statistics(self, params: dict[str, Any]) -> Any | None:
-        """Get statistics from cache."""
-        key = self._generate_key("statistics", params)
-        return await self.get(key)
+    def get_statistics(
+        self, params: dict[str, Any], cache_key: str | None = None
+    ) -> tuple[Any | None, bool]:
+        """Get statistics from cache as (value, is_stale), using cache_key verbatim if given."""
+        key = cache_key or self._generate_key("statistics", params)
+        return self.get_with_staleness(key)
 
-    async def set_statistics(self, params: dict[str, Any], value: Any) -> None:
-        """Set statistics in cache."""
-        key = self._generate_key("statistics", params)
-        await self.set(key, value, "statistics")
+    def set_statistics(self, params: dict[str, Any], value: Any, cache_key: str | None = None) -> None:
+        """Set statistics in cache, using cache_key verbatim if given."""
+        key = cache_key or self._generate_key("statistics", params)
+        self.set(key, value, "statistics")
 
-    async def get_standings(self, params: dict[str, Any]) -> Any | None:
+    def get_standings(self, params: dict[str, Any]) -> Any | None:
         """Get standings from cache."""
         key = self._generate_key("standings", params)
-        return await self.get(key)
+        return self.get(key)
 
-    async def set_standings(self, params: dict[str, Any], value: Any) -> None:
+    def set_standings(self, params: dict[str, Any], value: Any) -> None:
         """Set standings in cache."""
         key = self._generate_key("standings", params)
-        await self.set(key, value, "standings")
+        self.set(key, value, "standings")
 
-    async def get_predictions(self, params: dict[str, Any]) -> Any | None:
+    def get_predictions(self, params: dict[str, Any]) -> Any | None:
         """Get predictions from cache."""
         key = self._generate_key("predictions", params)
-        return await self.get(key)
+        return self.get(key)
 
-    async def set_predictions(self, params: dict[str, Any], value: Any) -> None:
+    def set_predictions(self, params: dict[str, Any], value: Any) -> None:
         """Set predictions in cache."""
         key = self._generate_key("predictions", params)
-        await self.set(key, value, "predictions")
+        self.set(key, value, "predictions")
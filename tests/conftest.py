@@ -1,58 +1,265 @@
 """Pytest configuration and fixtures."""
 
-from typing import Any
-from unittest.mock import MagicMock, patch
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import Any, Final
+from unittest.mock import AsyncMock, patch
 
+import orjson
 import pytest
 
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
 from mcp_server_api_sports.models import ApiResponse
 from mcp_server_api_sports.services import ApiSportsService, CacheService
 
 
-@pytest.fixture
+@dataclass(slots=True)
+class StubResponse:
+    """Stand-in for the parts of httpx.Response that make_request reads."""
+
+    status_code: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    content: bytes = b""
+    request: Any = None
+
+    @property
+    def text(self) -> str:
+        return self.content.decode()
+
+    def json(self) -> Any:
+        return orjson.loads(self.content)
+
+
+class StubClient:
+    """Stand-in for httpx.AsyncClient that replays queued responses from get()."""
+
+    def __init__(self, *responses: StubResponse) -> None:
+        self.responses = deque(responses)
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def get(self, url: str, **kwargs: Any) -> StubResponse:
+        self.calls.append((url, kwargs))
+        return self.responses.popleft()
+
+    async def aclose(self) -> None:
+        pass
+
+
+class AsyncReturn:
+    """Async callable that returns a fixed value, for stubs only checked via call_count."""
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.call_count = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        return self.value
+
+
+class AsyncRaise:
+    """Async callable that raises a fixed exception, for stubs of failing endpoints."""
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+        self.call_count = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.call_count += 1
+        raise self.exc
+
+
+class FakeClock:
+    """Manually driven time source for CacheService."""
+
+    def __init__(self, now: float = 0.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def make_http_response(
+    status: int = 200,
+    json_data: Any = None,
+    headers: dict[str, str] | None = None,
+) -> StubResponse:
+    """Build a stub HTTP response with a JSON-encoded body."""
+    content = orjson.dumps(json_data) if json_data is not None else b""
+    return StubResponse(status_code=status, headers=headers or {}, content=content)
+
+
+# Settings used by the services under test
+_SETTINGS = SimpleNamespace(
+    api_sports_api_key="test_api_key",
+    api_sports_base_url="https://v3.football.api-sports.io",
+    cache_enabled=True,
+    cache_max_size=100,
+    cache_ttl_teams=3600,
+    cache_ttl_fixtures_completed=0,
+    cache_ttl_fixtures_upcoming=1800,
+    cache_ttl_statistics=3600,
+    cache_ttl_standings=1800,
+    cache_ttl_predictions=3600,
+    rate_limit_calls_per_minute=30,
+    rate_limit_calls_per_day=100,
+    rate_limit_burst_size=10,
+    rate_limit_backoff_factor=2.0,
+    rate_limit_max_retries=3,
+    log_level="INFO",
+    log_file_path="test.log",
+    log_rotation_size="10MB",
+    log_retention_days=7,
+    log_format="json",
+)
+
+
+DATA_DIR = Path(__file__).parent / "data"
+
+
+@lru_cache
+def _load(name: str) -> Any:
+    """Load a JSON document from tests/data, parsing each file once."""
+    return orjson.loads((DATA_DIR / name).read_bytes())
+
+
+# Mock API payloads; they never vary between tests, so they are read-only
+# module constants rather than fixtures
+MOCK_TEAM_RESPONSE: Final[Mapping[str, Any]] = MappingProxyType(_load("teams.json"))
+MOCK_FIXTURE_RESPONSE: Final[Mapping[str, Any]] = MappingProxyType(_load("fixtures.json"))
+MOCK_STATISTICS_RESPONSE: Final[Mapping[str, Any]] = MappingProxyType(_load("statistics.json"))
+
+
+if uvloop is not None:
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop, which has less per-await overhead."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@lru_cache
+def make_fixture_response(*, id: int = 1035000, status: str = "FT") -> ApiResponse:
+    """Build the mock fixture response for another fixture ID and status.
+
+    Responses are memoized per argument set and must not be mutated.
+    """
+    fixture = MOCK_FIXTURE_RESPONSE["response"][0]
+    return ApiResponse.model_construct(**{
+        **MOCK_FIXTURE_RESPONSE,
+        "response": [{
+            **fixture,
+            "fixture": {**fixture["fixture"], "id": id, "status": {"short": status}},
+        }],
+    })
+
+
+# Endpoint methods replaced by api_service_with_stubs
+_STUBBED_ENDPOINTS = (
+    "get_teams",
+    "get_fixtures",
+    "get_team_statistics",
+    "get_standings",
+    "get_fixtures_head2head",
+    "get_fixture_statistics",
+    "get_fixture_events",
+    "get_fixture_lineups",
+    "get_predictions",
+)
+
+
+@pytest.fixture(scope="session")
 def mock_settings():
     """Mock settings for testing."""
-    with patch("mcp_server_api_sports.config.get_settings") as mock:
-        settings = MagicMock()
-        settings.api_sports_api_key = "test_api_key"
-        settings.api_sports_base_url = "https://v3.football.api-sports.io"
-        settings.cache_enabled = True
-        settings.cache_max_size = 100
-        settings.cache_ttl_teams = 3600
-        settings.cache_ttl_fixtures_completed = 0
-        settings.cache_ttl_fixtures_upcoming = 1800
-        settings.cache_ttl_statistics = 3600
-        settings.cache_ttl_standings = 1800
-        settings.cache_ttl_predictions = 3600
-        settings.rate_limit_calls_per_minute = 30
-        settings.rate_limit_calls_per_day = 100
-        settings.rate_limit_burst_size = 10
-        settings.rate_limit_backoff_factor = 2.0
-        settings.rate_limit_max_retries = 3
-        settings.log_level = "INFO"
-        settings.log_file_path = "test.log"
-        settings.log_rotation_size = "10MB"
-        settings.log_retention_days = 7
-        settings.log_format = "json"
-        mock.return_value = settings
-        yield settings
+    # The services bind get_settings at import time, so patch their own names
+    with (
+        patch("mcp_server_api_sports.services.api_sports_service.get_settings", return_value=_SETTINGS),
+        patch("mcp_server_api_sports.services.cache_service.get_settings", return_value=_SETTINGS),
+    ):
+        yield _SETTINGS
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def api_service(mock_settings):
-    """Create API service instance for testing."""
+    """Create API service instance shared by the whole test session."""
     service = ApiSportsService()
     yield service
     await service.close()
 
 
+@pytest.fixture(autouse=True)
+def _reset_api_service(api_service, cache_service):
+    """Return the shared API service to a fresh state, wired to the shared cache."""
+    api_service.cache_service = cache_service
+    api_service.client = None
+    api_service.rate_limiter.reset()
+    api_service._inflight.clear()
+    api_service._revalidating.clear()
+
+
 @pytest.fixture
-def cache_service(mock_settings):
-    """Create cache service instance for testing."""
-    return CacheService()
+def api_service_with_stubs(api_service):
+    """api_service with its API endpoint methods stubbed out."""
+    for name in _STUBBED_ENDPOINTS:
+        setattr(api_service, name, AsyncMock())
+    yield api_service
+    # The service outlives the test, so drop the stubs to expose the real methods
+    for name in _STUBBED_ENDPOINTS:
+        delattr(api_service, name)
 
 
 @pytest.fixture
+def teams_ctx(api_service_with_stubs, cache_service, clock, team_api_response):
+    """Stubbed service wired for teams searches, with get_teams returning team_api_response."""
+    api_service_with_stubs.get_teams.return_value = team_api_response
+    return SimpleNamespace(
+        service=api_service_with_stubs,
+        cache=cache_service,
+        clock=clock,
+        mock_get=api_service_with_stubs.get_teams,
+        response=team_api_response,
+    )
+
+
+@pytest.fixture
+def http_client(api_service):
+    """Stub HTTP client installed on api_service; tests queue responses on it."""
+    client = StubClient()
+    api_service.client = client
+    return client
+
+
+@pytest.fixture(scope="session")
+def clock():
+    """Fake clock driving cache_service; advance it to age entries."""
+    return FakeClock()
+
+
+@pytest.fixture(scope="session")
+def cache_service(mock_settings, clock):
+    """Create cache service instance shared by the whole test session."""
+    return CacheService(clock=clock)
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache_service(cache_service, clock):
+    """Return the shared cache and its clock to a fresh state."""
+    clock.now = 0.0
+    # Also restores max_size, which tests shrink to exercise eviction
+    cache_service.reset()
+
+
+@pytest.fixture(scope="session")
 def mock_api_response():
     """Factory for creating mock API responses."""
     def _create_response(
@@ -61,7 +268,8 @@ def mock_api_response():
         response_data: list = None,
         errors: Any = None
     ) -> ApiResponse:
-        return ApiResponse(
+        # Trusted test data; make_request validates whatever is sent over the wire
+        return ApiResponse.model_construct(
             get=endpoint,
             parameters={},
             errors=errors or [],
@@ -72,229 +280,59 @@ def mock_api_response():
     return _create_response
 
 
-@pytest.fixture
-def mock_team_response():
-    """Mock team API response."""
-    return {
-        "get": "teams",
-        "parameters": {"id": "33"},
-        "errors": [],
-        "results": 1,
-        "paging": {"current": 1, "total": 1},
-        "response": [
-            {
-                "team": {
-                    "id": 33,
-                    "name": "Manchester United",
-                    "code": "MUN",
-                    "country": "England",
-                    "founded": 1878,
-                    "national": False,
-                    "logo": "https://media.api-sports.io/football/teams/33.png"
-                },
-                "venue": {
-                    "id": 556,
-                    "name": "Old Trafford",
-                    "address": "Sir Matt Busby Way",
-                    "city": "Manchester",
-                    "capacity": 74879,
-                    "surface": "grass",
-                    "image": "https://media.api-sports.io/football/venues/556.png"
-                }
-            }
-        ]
-    }
+@pytest.fixture(scope="session")
+def mock_teams_response(mock_api_response):
+    """Serialized single-team /teams payload, built once per session."""
+    return mock_api_response(
+        endpoint="/teams",
+        results=1,
+        response_data=[{"team": {"id": 1, "name": "Test Team"}}]
+    ).model_dump()
 
 
-@pytest.fixture
-def mock_fixture_response():
-    """Mock fixture API response."""
-    return {
-        "get": "fixtures",
-        "parameters": {"id": "1035000"},
-        "errors": [],
-        "results": 1,
-        "paging": {"current": 1, "total": 1},
-        "response": [
-            {
-                "fixture": {
-                    "id": 1035000,
-                    "referee": "Michael Oliver",
-                    "timezone": "UTC",
-                    "date": "2024-01-15T20:00:00+00:00",
-                    "timestamp": 1705344000,
-                    "periods": {
-                        "first": 1705344000,
-                        "second": 1705347600
-                    },
-                    "venue": {
-                        "id": 556,
-                        "name": "Old Trafford",
-                        "city": "Manchester"
-                    },
-                    "status": {
-                        "long": "Match Finished",
-                        "short": "FT",
-                        "elapsed": 90
-                    }
-                },
-                "league": {
-                    "id": 39,
-                    "name": "Premier League",
-                    "country": "England",
-                    "logo": "https://media.api-sports.io/football/leagues/39.png",
-                    "flag": "https://media.api-sports.io/flags/gb.svg",
-                    "season": 2023,
-                    "round": "Regular Season - 21"
-                },
-                "teams": {
-                    "home": {
-                        "id": 33,
-                        "name": "Manchester United",
-                        "logo": "https://media.api-sports.io/football/teams/33.png",
-                        "winner": True
-                    },
-                    "away": {
-                        "id": 40,
-                        "name": "Liverpool",
-                        "logo": "https://media.api-sports.io/football/teams/40.png",
-                        "winner": False
-                    }
-                },
-                "goals": {
-                    "home": 2,
-                    "away": 1
-                },
-                "score": {
-                    "halftime": {
-                        "home": 1,
-                        "away": 0
-                    },
-                    "fulltime": {
-                        "home": 2,
-                        "away": 1
-                    },
-                    "extratime": {
-                        "home": None,
-                        "away": None
-                    },
-                    "penalty": {
-                        "home": None,
-                        "away": None
-                    }
-                }
-            }
-        ]
-    }
+@pytest.fixture(scope="session")
+def team_api_response():
+    """Parsed team API response, built once per session without validation."""
+    return ApiResponse.model_construct(**MOCK_TEAM_RESPONSE)
 
 
-@pytest.fixture
-def mock_statistics_response():
-    """Mock team statistics API response."""
-    return {
-        "get": "teams/statistics",
-        "parameters": {
-            "league": "39",
-            "season": "2023",
-            "team": "33"
-        },
-        "errors": [],
-        "results": 1,
-        "paging": {"current": 1, "total": 1},
-        "response": [{
-            "league": {
-                "id": 39,
-                "name": "Premier League",
-                "country": "England",
-                "logo": "https://media.api-sports.io/football/leagues/39.png",
-                "flag": "https://media.api-sports.io/flags/gb.svg",
-                "season": 2023
-            },
-            "team": {
-                "id": 33,
-                "name": "Manchester United",
-                "logo": "https://media.api-sports.io/football/teams/33.png"
-            },
-            "form": "WDWLW",
-            "fixtures": {
-                "played": {"home": 10, "away": 10, "total": 20},
-                "wins": {"home": 7, "away": 5, "total": 12},
-                "draws": {"home": 2, "away": 2, "total": 4},
-                "loses": {"home": 1, "away": 3, "total": 4}
-            },
-            "goals": {
-                "for": {
-                    "total": {"home": 25, "away": 20, "total": 45},
-                    "average": {"home": "2.5", "away": "2.0", "total": "2.3"},
-                    "minute": {
-                        "0-15": {"total": 5, "percentage": "11.11%"},
-                        "16-30": {"total": 8, "percentage": "17.78%"},
-                        "31-45": {"total": 6, "percentage": "13.33%"},
-                        "46-60": {"total": 10, "percentage": "22.22%"},
-                        "61-75": {"total": 9, "percentage": "20.00%"},
-                        "76-90": {"total": 7, "percentage": "15.56%"}
-                    }
-                },
-                "against": {
-                    "total": {"home": 10, "away": 15, "total": 25},
-                    "average": {"home": "1.0", "away": "1.5", "total": "1.3"},
-                    "minute": {
-                        "0-15": {"total": 3, "percentage": "12.00%"},
-                        "16-30": {"total": 4, "percentage": "16.00%"},
-                        "31-45": {"total": 5, "percentage": "20.00%"},
-                        "46-60": {"total": 6, "percentage": "24.00%"},
-                        "61-75": {"total": 4, "percentage": "16.00%"},
-                        "76-90": {"total": 3, "percentage": "12.00%"}
-                    }
-                }
-            },
-            "biggest": {
-                "streak": {"wins": 4, "draws": 2, "loses": 2},
-                "wins": {"home": "4-0", "away": "3-1"},
-                "loses": {"home": "1-2", "away": "0-3"},
-                "goals": {
-                    "for": {"home": 4, "away": 3},
-                    "against": {"home": 2, "away": 3}
-                }
-            },
-            "clean_sheet": {"home": 4, "away": 3, "total": 7},
-            "failed_to_score": {"home": 1, "away": 2, "total": 3},
-            "penalty": {
-                "scored": {"total": 3, "percentage": "100.00%"},
-                "missed": {"total": 0, "percentage": "0.00%"},
-                "total": 3
-            },
-            "lineups": [
-                {
-                    "formation": "4-2-3-1",
-                    "played": 15
-                },
-                {
-                    "formation": "4-3-3",
-                    "played": 5
-                }
-            ],
-            "cards": {
-                "yellow": {
-                    "0-15": {"total": 2, "percentage": "6.67%"},
-                    "16-30": {"total": 3, "percentage": "10.00%"},
-                    "31-45": {"total": 5, "percentage": "16.67%"},
-                    "46-60": {"total": 8, "percentage": "26.67%"},
-                    "61-75": {"total": 7, "percentage": "23.33%"},
-                    "76-90": {"total": 5, "percentage": "16.67%"},
-                    "91-105": {"total": None, "percentage": None},
-                    "106-120": {"total": None, "percentage": None}
-                },
-                "red": {
-                    "0-15": {"total": 0, "percentage": "0.00%"},
-                    "16-30": {"total": 0, "percentage": "0.00%"},
-                    "31-45": {"total": 0, "percentage": "0.00%"},
-                    "46-60": {"total": 1, "percentage": "50.00%"},
-                    "61-75": {"total": 1, "percentage": "50.00%"},
-                    "76-90": {"total": 0, "percentage": "0.00%"},
-                    "91-105": {"total": None, "percentage": None},
-                    "106-120": {"total": None, "percentage": None}
-                }
-            }
-        }]
-    }
+@pytest.fixture(scope="session")
+def fixture_api_response():
+    """Parsed fixture API response, built once per session without validation."""
+    return ApiResponse.model_construct(**MOCK_FIXTURE_RESPONSE)
+
+
+@pytest.fixture(scope="session")
+def statistics_api_response():
+    """Parsed team statistics API response, built once per session without validation."""
+    return ApiResponse.model_construct(**MOCK_STATISTICS_RESPONSE)
+
+
+@pytest.fixture(scope="session")
+def standings_api_response():
+    """Parsed standings API response, built once per session without validation."""
+    return ApiResponse.model_construct(**_load("standings.json"))
+
+
+@pytest.fixture(scope="session")
+def fixture_statistics_api_response():
+    """Parsed fixture statistics API response, built once per session without validation."""
+    return ApiResponse.model_construct(**_load("fixture_statistics.json"))
+
+
+@pytest.fixture(scope="session")
+def fixture_events_api_response():
+    """Parsed fixture events API response, built once per session without validation."""
+    return ApiResponse.model_construct(**_load("fixture_events.json"))
+
+
+@pytest.fixture(scope="session")
+def fixture_lineups_api_response():
+    """Parsed fixture lineups API response, built once per session without validation."""
+    return ApiResponse.model_construct(**_load("fixture_lineups.json"))
+
+
+@pytest.fixture(scope="session")
+def predictions_api_response():
+    """Parsed predictions API response, built once per session without validation."""
+    return ApiResponse.model_construct(**_load("predictions.json"))
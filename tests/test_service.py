@@ -1,88 +1,118 @@
 """Tests for API-Sports service."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import os
+from bisect import bisect_left
+from unittest.mock import AsyncMock
 
 import pytest
 
+from mcp_server_api_sports.services.api_sports_service import (
+    RateLimiter,
+    _is_valid_date,
+    _new_request_id,
+)
+from tests.conftest import (
+    AsyncRaise,
+    AsyncReturn,
+    StubResponse,
+    make_fixture_response,
+    make_http_response,
+)
+
 
 @pytest.mark.asyncio
-async def test_api_service_initialization(api_service):
+async def test_api_service_initialization(api_service, mock_settings):
     """Test API service initialization."""
+    assert api_service.settings is mock_settings
     assert api_service.base_url == "https://v3.football.api-sports.io"
     assert api_service.api_key == "test_api_key"
     assert api_service.rate_limiter is not None
 
 
+@pytest.mark.ratelimit
 @pytest.mark.asyncio
-async def test_api_service_make_request_success(api_service, mock_api_response):
+async def test_api_service_make_request_success(api_service, http_client, mock_teams_response):
     """Test successful API request."""
-    mock_response_data = mock_api_response(
-        endpoint="/teams",
-        results=1,
-        response_data=[{"team": {"id": 1, "name": "Test Team"}}]
-    )
+    http_client.responses.append(make_http_response(200, mock_teams_response))
 
-    with patch.object(api_service, "_get_client") as mock_get_client:
-        mock_client = AsyncMock()
-        mock_http_response = MagicMock()
-        mock_http_response.status_code = 200
-        mock_http_response.headers = {}
-        mock_http_response.json.return_value = mock_response_data.model_dump()
-        mock_client.get.return_value = mock_http_response
-        mock_get_client.return_value = mock_client
+    response = await api_service.make_request("/teams", {"id": 1})
 
-        response = await api_service.make_request("/teams", {"id": 1})
-
-        assert response.results == 1
-        assert len(response.response) == 1
-        mock_client.get.assert_called_once_with("/teams", params={"id": 1})
+    assert response.results == 1
+    assert len(response.response) == 1
+    assert http_client.calls == [("/teams", {"params": {"id": 1}})]
 
 
+@pytest.mark.ratelimit
 @pytest.mark.asyncio
-async def test_api_service_rate_limiting(api_service):
+async def test_api_service_rate_limiting(api_service, http_client, monkeypatch):
     """Test rate limiting behavior."""
-    with patch.object(api_service, "_get_client") as mock_get_client:
-        mock_client = AsyncMock()
-        mock_http_response = MagicMock()
-        mock_http_response.status_code = 429
-        mock_http_response.headers = {"Retry-After": "1"}
-        mock_client.get.return_value = mock_http_response
-
+    http_client.responses += [
+        make_http_response(429, headers={"Retry-After": "1"}),
         # Second attempt succeeds
-        mock_success_response = MagicMock()
-        mock_success_response.status_code = 200
-        mock_success_response.headers = {}
-        mock_success_response.json.return_value = {
+        make_http_response(200, {
             "get": "/test",
             "parameters": {},
             "errors": [],
             "results": 0,
             "response": []
-        }
-        mock_client.get.side_effect = [mock_http_response, mock_success_response]
-        mock_get_client.return_value = mock_client
+        }),
+    ]
 
-        with patch("asyncio.sleep", new_callable=AsyncMock):
-            response = await api_service.make_request("/test")
-            assert response.results == 0
+    mock_sleep = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", mock_sleep)
 
+    response = await api_service.make_request("/test")
+    assert response.results == 0
 
+    # Both scripted responses were consumed, honouring Retry-After in between
+    assert len(http_client.calls) == 2
+    assert not http_client.responses
+    mock_sleep.assert_awaited_once_with(1)
+
+
+@pytest.mark.ratelimit
 @pytest.mark.asyncio
-async def test_cache_service_get_set(cache_service):
+async def test_api_service_retries_truncated_body(api_service, http_client, monkeypatch):
+    """Test that a truncated 200 body is retried rather than raised."""
+    http_client.responses += [
+        StubResponse(200, content=b'{"get": "/te'),
+        make_http_response(200, {
+            "get": "/test",
+            "parameters": {},
+            "errors": [],
+            "results": 0,
+            "response": []
+        }),
+    ]
+
+    mock_sleep = AsyncMock()
+    monkeypatch.setattr(asyncio, "sleep", mock_sleep)
+
+    response = await api_service.make_request("/test")
+    assert response.results == 0
+
+    # The good response was fetched after one backoff sleep
+    assert len(http_client.calls) == 2
+    assert not http_client.responses
+    mock_sleep.assert_awaited_once_with(1)
+
+
+@pytest.mark.cache
+def test_cache_service_get_set(cache_service):
     """Test cache get and set operations."""
     key = "test_key"
     value = {"data": "test"}
 
     # Initially empty
-    result = await cache_service.get(key)
+    result = cache_service.get(key)
     assert result is None
 
     # Set value
-    await cache_service.set(key, value, "teams")
+    cache_service.set(key, value, "teams")
 
     # Get value
-    result = await cache_service.get(key)
+    result = cache_service.get(key)
     assert result == value
 
     # Check stats
@@ -91,80 +121,150 @@ async def test_cache_service_get_set(cache_service):
     assert stats["misses"] == 1
 
 
-@pytest.mark.asyncio
-async def test_cache_service_ttl_expiration(cache_service):
+@pytest.mark.cache
+def test_cache_service_ttl_expiration(cache_service, clock, monkeypatch):
     """Test cache TTL expiration."""
 
     key = "test_key"
     value = {"data": "test"}
 
     # Set with very short TTL
-    with patch.object(cache_service, "_get_ttl", return_value=0.1):
-        await cache_service.set(key, value, "teams")
+    monkeypatch.setattr(cache_service, "_get_ttl", lambda cache_type: 0.1)
+    cache_service.set(key, value, "teams")
 
     # Should be available immediately
-    result = await cache_service.get(key)
+    result = cache_service.get(key)
     assert result == value
 
-    # Wait for expiration
-    await asyncio.sleep(0.2)
+    # Move the clock past expiration instead of waiting for it
+    clock.advance(1.0)
+    result = cache_service.get(key)
 
     # Should be expired
-    result = await cache_service.get(key)
     assert result is None
 
 
-@pytest.mark.asyncio
-async def test_cache_service_lru_eviction(cache_service):
+@pytest.mark.cache
+def test_cache_service_lru_eviction(cache_service):
     """Test LRU eviction when cache is full."""
     cache_service.max_size = 2
 
     # Add items to fill cache
-    await cache_service.set("key1", "value1", "teams")
-    await cache_service.set("key2", "value2", "teams")
+    cache_service.set("key1", "value1", "teams")
+    cache_service.set("key2", "value2", "teams")
 
     # Access key1 to make it more recently used
-    await cache_service.get("key1")
+    cache_service.get("key1")
 
     # Add another item, should evict key2
-    await cache_service.set("key3", "value3", "teams")
+    cache_service.set("key3", "value3", "teams")
 
     # key1 and key3 should be present
-    assert await cache_service.get("key1") == "value1"
-    assert await cache_service.get("key3") == "value3"
+    assert cache_service.get("key1") == "value1"
+    assert cache_service.get("key3") == "value3"
 
     # key2 should be evicted
-    assert await cache_service.get("key2") is None
+    assert cache_service.get("key2") is None
 
     # Check eviction count
     assert cache_service.evictions == 1
 
 
-@pytest.mark.asyncio
-async def test_cache_service_invalidation(cache_service):
+@pytest.mark.cache
+def test_cache_service_key_list_tracks_entries(cache_service):
+    """Test that the sampled key list stays in step with the cache."""
+    cache_service.max_size = 8
+    for i in range(20):
+        cache_service.set(f"teams:{i}", i, "teams")
+        cache_service.set(f"fixtures:id:{i}", i, "fixtures_upcoming")
+    cache_service.set("teams:19", "again", "teams")
+    cache_service.invalidate(":id:1")
+    cache_service.invalidate("teams:")
+
+    assert sorted(cache_service._keys) == sorted(cache_service.cache)
+    for pos, key in enumerate(cache_service._keys):
+        assert cache_service.cache[key].pos == pos
+
+
+@pytest.mark.cache
+def test_cache_service_invalidation(cache_service):
     """Test cache invalidation."""
     # Add multiple items
-    await cache_service.set("teams:1", "team1", "teams")
-    await cache_service.set("teams:2", "team2", "teams")
-    await cache_service.set("fixtures:1", "fixture1", "fixtures_upcoming")
+    cache_service.set("teams:1", "team1", "teams")
+    cache_service.set("teams:2", "team2", "teams")
+    cache_service.set("fixtures:1", "fixture1", "fixtures_upcoming")
 
     # Invalidate teams
-    count = await cache_service.invalidate("teams:")
+    count = cache_service.invalidate("teams:")
     assert count == 2
 
     # Teams should be gone
-    assert await cache_service.get("teams:1") is None
-    assert await cache_service.get("teams:2") is None
+    assert cache_service.get("teams:1") is None
+    assert cache_service.get("teams:2") is None
 
     # Fixtures should remain
-    assert await cache_service.get("fixtures:1") == "fixture1"
+    assert cache_service.get("fixtures:1") == "fixture1"
 
     # Clear all
-    count = await cache_service.invalidate()
+    count = cache_service.invalidate()
     assert count == 1
-    assert await cache_service.get("fixtures:1") is None
+    assert cache_service.get("fixtures:1") is None
+
+
+@pytest.mark.cache
+def test_cache_service_invalidation_substring(cache_service):
+    """Test invalidation by a pattern that is not a namespace prefix."""
+    cache_service.set("teams:1", "team1", "teams")
+    cache_service.set("fixtures:id:1", "fixture1", "fixtures_upcoming")
+    cache_service.set("fixtures:id:2", "fixture2", "fixtures_upcoming")
+
+    assert cache_service.invalidate(":id:") == 2
+    assert cache_service.get("teams:1") == "team1"
+
+    # The namespace index no longer lists the removed keys
+    assert cache_service.invalidate("fixtures:") == 0
+
 
+@pytest.mark.cache
+def test_cache_service_cleanup_expired(cache_service, clock, monkeypatch):
+    """Test cleanup of expired entries, skipping overwritten ones."""
+    monkeypatch.setattr(cache_service, "_get_ttl", lambda cache_type: 10)
+    cache_service.set("short", "value", "teams")
+    cache_service.set("overwritten", "old", "teams")
 
+    # Overwrite with a long TTL; the stale heap entry must not evict it
+    monkeypatch.setattr(cache_service, "_get_ttl", lambda cache_type: 3600)
+    cache_service.set("overwritten", "new", "teams")
+
+    clock.advance(60)
+    assert cache_service.cleanup_expired() == 1
+
+    assert "short" not in cache_service.cache
+    assert cache_service.get("overwritten") == "new"
+
+
+@pytest.mark.cache
+def test_cache_service_expiry_heap_stays_bounded(cache_service):
+    """Test that overwrites and evictions do not grow the expiry heap without bound."""
+    cache_service.max_size = 10
+    for i in range(1000):
+        cache_service.set(f"key{i % 20}", i, "teams")
+        assert len(cache_service._exp_heap) <= 2 * len(cache_service.cache)
+
+    # Every live entry is still tracked
+    assert {key for _, key in cache_service._exp_heap} >= set(cache_service.cache)
+
+
+@pytest.mark.cache
+def test_cache_service_fixtures_id_key(cache_service):
+    """Test that single-ID fixture lookups use the ID as the cache key."""
+    cache_service.set_fixtures({"id": 1035000}, "fixture", is_completed=True)
+
+    assert "fixtures:id:1035000" in cache_service.cache
+    assert cache_service.get_fixtures({"id": 1035000}) == "fixture"
+
+
+@pytest.mark.ratelimit
 @pytest.mark.asyncio
 async def test_rate_limiter_acquire(api_service):
     """Test rate limiter acquire method."""
@@ -178,501 +278,494 @@ async def test_rate_limiter_acquire(api_service):
     assert remaining["day"] == 99  # 100 - 1
 
 
-# Tests for search_teams method (moved from test_tools/test_teams.py)
-
+@pytest.mark.ratelimit
 @pytest.mark.asyncio
-async def test_search_teams_by_id(api_service, cache_service, mock_team_response):
-    """Test searching teams by ID."""
-    api_service.cache_service = cache_service
+async def test_rate_limiter_never_exceeds_quota(clock, monkeypatch):
+    """Test that no minute or day window ever holds more calls than its quota."""
+    limiter = RateLimiter(calls_per_minute=30, calls_per_day=100, burst_size=10, clock=clock)
 
-    # Mock API response
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_team_response)
+    async def fake_sleep(seconds):
+        clock.advance(seconds)
 
-    with patch.object(api_service, "get_teams", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
 
-        result = await api_service.search_teams(id=33)
+    calls = []
+    for _ in range(250):
+        await limiter.acquire()
+        calls.append(clock())
+        clock.advance(1)
 
-        assert result["count"] == 1
-        assert len(result["teams"]) == 1
-        assert result["teams"][0]["id"] == 33
-        assert result["teams"][0]["name"] == "Manchester United"
-        assert result["teams"][0]["venue"]["name"] == "Old Trafford"
+    # The 31st call waits for the first to leave the minute window
+    assert calls[30] == 60
+    # 250 calls at 100 per day need more than two days
+    assert calls[-1] >= 2 * 86400
 
-        mock_get.assert_called_once_with(
-            id=33,
-            name=None,
-            league=None,
-            season=None,
-            country=None,
-            code=None,
-            venue=None,
-            search=None
-        )
+    for window, quota in ((60, 30), (86400, 100)):
+        for i, start in enumerate(calls):
+            assert bisect_left(calls, start + window) - i <= quota
 
 
-@pytest.mark.asyncio
-async def test_search_teams_validation(api_service, cache_service):
-    """Test search parameter validation."""
-    api_service.cache_service = cache_service
+# Tests for search_teams method (moved from test_tools/test_teams.py)
 
-    # Search string too short
-    result = await api_service.search_teams(search="ab")
+@pytest.mark.search
+@pytest.mark.asyncio
+async def test_search_teams_by_id(teams_ctx):
+    """Test searching teams by ID."""
+    result = await teams_ctx.service.search_teams(id=33)
 
-    assert "error" in result
-    assert "at least 3 characters" in result["error"]
+    assert result["count"] == 1
+    assert len(result["teams"]) == 1
+    assert result["teams"][0]["id"] == 33
+    assert result["teams"][0]["name"] == "Manchester United"
+    assert result["teams"][0]["venue"]["name"] == "Old Trafford"
 
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_search_teams_with_cache(api_service, cache_service, mock_team_response):
+async def test_search_teams_with_cache(teams_ctx):
     """Test teams search with caching."""
-    api_service.cache_service = cache_service
+    mock_get = teams_ctx.service.get_teams = AsyncReturn(teams_ctx.response)
 
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_team_response)
+    # First call - should hit API
+    result1 = await teams_ctx.service.search_teams(id=33)
+    assert mock_get.call_count == 1
 
-    with patch.object(api_service, "get_teams", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    # Second call - should hit cache
+    result2 = await teams_ctx.service.search_teams(id=33)
+    assert mock_get.call_count == 1  # No additional API call
 
-        # First call - should hit API
-        result1 = await api_service.search_teams(id=33)
-        assert mock_get.call_count == 1
-
-        # Second call - should hit cache
-        result2 = await api_service.search_teams(id=33)
-        assert mock_get.call_count == 1  # No additional API call
-
-        # Results should be identical
-        assert result1 == result2
+    # The cached result is returned as is, without being rebuilt
+    assert result2 is result1
 
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_search_teams_multiple_params(api_service, cache_service, mock_team_response):
-    """Test searching teams with multiple parameters."""
-    api_service.cache_service = cache_service
-
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_team_response)
+async def test_search_teams_stale_cache_revalidates(teams_ctx):
+    """Test that a stale cached result is served while it is refreshed in the background."""
+    mock_get = teams_ctx.service.get_teams = AsyncReturn(teams_ctx.response)
 
-    with patch.object(api_service, "get_teams", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    result1 = await teams_ctx.service.search_teams(id=33)
+    assert mock_get.call_count == 1
 
-        result = await api_service.search_teams(
-            name="Manchester United",
-            league=39,
-            season=2023,
-            country="England"
-        )
+    # Age the entry past the stale threshold but not past expiry
+    teams_ctx.clock.advance(teams_ctx.cache._get_ttl("teams") * 0.9)
 
-        assert result["count"] == 1
+    result2 = await teams_ctx.service.search_teams(id=33)
+    assert result2 == result1
 
-        mock_get.assert_called_once_with(
-            id=None,
-            name="Manchester United",
-            league=39,
-            season=2023,
-            country="England",
-            code=None,
-            venue=None,
-            search=None
-        )
+    await asyncio.gather(*teams_ctx.service._background_tasks)
+    assert mock_get.call_count == 2
+    assert not next(iter(teams_ctx.cache.cache.values())).is_stale(teams_ctx.clock())
 
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_search_teams_error_handling(api_service, cache_service):
-    """Test error handling in teams search."""
-    api_service.cache_service = cache_service
+async def test_search_teams_concurrent_requests_share_fetch(teams_ctx):
+    """Test that concurrent identical requests make a single API call."""
+    async def slow_get_teams(**kwargs):
+        # Yield once so the other searches start while this fetch is in flight
+        await asyncio.sleep(0)
+        return teams_ctx.response
 
-    with patch.object(api_service, "get_teams", new_callable=AsyncMock) as mock_get:
-        mock_get.side_effect = Exception("API Error")
+    mock_get = teams_ctx.mock_get
+    mock_get.side_effect = slow_get_teams
+    results = await asyncio.gather(*(teams_ctx.service.search_teams(id=33) for _ in range(5)))
 
-        result = await api_service.search_teams(id=33)
+    assert mock_get.call_count == 1
+    assert all(result == results[0] for result in results)
+    assert teams_ctx.service._inflight == {}
 
-        assert "error" in result
-        assert "Failed to search teams" in result["error"]
-
-
-# Tests for search_fixtures method (moved from test_tools/test_fixtures.py)
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_search_fixtures_by_id(api_service, cache_service, mock_fixture_response):
-    """Test searching fixtures by ID."""
-    api_service.cache_service = cache_service
+async def test_search_teams_cancelled_caller_keeps_shared_fetch(teams_ctx):
+    """Test that cancelling the first caller does not fail the others sharing its fetch."""
+    release = asyncio.Event()
 
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_fixture_response)
+    async def blocked_get_teams(**kwargs):
+        await release.wait()
+        return teams_ctx.response
 
-    with patch.object(api_service, "get_fixtures", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    mock_get = teams_ctx.mock_get
+    mock_get.side_effect = blocked_get_teams
+    first = asyncio.create_task(teams_ctx.service.search_teams(id=33))
+    second = asyncio.create_task(teams_ctx.service.search_teams(id=33))
+    await asyncio.sleep(0)
 
-        result = await api_service.search_fixtures(id=1035000)
+    first.cancel()
+    release.set()
 
-        assert result["count"] == 1
-        assert len(result["fixtures"]) == 1
-        assert result["fixtures"][0]["id"] == 1035000
-        assert result["fixtures"][0]["teams"]["home"]["name"] == "Manchester United"
-        assert result["fixtures"][0]["goals"]["home"] == 2
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    result = await second
+    assert result["count"] == 1
+    assert mock_get.call_count == 1
+    assert teams_ctx.service._inflight == {}
 
-        mock_get.assert_called_once()
 
+# Tests for search_fixtures method (moved from test_tools/test_fixtures.py)
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_search_fixtures_date_validation(api_service, cache_service):
-    """Test date parameter validation in fixtures search."""
-    api_service.cache_service = cache_service
-
-    # Invalid date format
-    result = await api_service.search_fixtures(date="15/01/2024")
-    assert "error" in result
-    assert "YYYY-MM-DD format" in result["error"]
+async def test_search_fixtures_by_id(api_service_with_stubs, fixture_api_response):
+    """Test searching fixtures by ID."""
+    api_service_with_stubs.get_fixtures.return_value = fixture_api_response
 
-    # Invalid from_date format
-    result = await api_service.search_fixtures(from_date="15/01/2024")
-    assert "error" in result
-    assert "YYYY-MM-DD format" in result["error"]
+    result = await api_service_with_stubs.search_fixtures(id=1035000)
 
-    # Invalid to_date format
-    result = await api_service.search_fixtures(to_date="2024/01/15")
-    assert "error" in result
-    assert "YYYY-MM-DD format" in result["error"]
+    assert result["count"] == 1
+    assert len(result["fixtures"]) == 1
+    assert result["fixtures"][0]["id"] == 1035000
+    assert result["fixtures"][0]["teams"]["home"]["name"] == "Manchester United"
+    assert result["fixtures"][0]["goals"]["home"] == 2
 
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_search_fixtures_last_next_validation(api_service, cache_service):
-    """Test last and next parameter validation."""
-    api_service.cache_service = cache_service
+async def test_search_fixtures_with_cache(api_service_with_stubs, fixture_api_response):
+    """Test that a cached fixtures result is returned as is."""
+    mock_get = api_service_with_stubs.get_fixtures = AsyncReturn(fixture_api_response)
 
-    # Last parameter too large
-    result = await api_service.search_fixtures(last=100)
-    assert "error" in result
-    assert "2 digits or less" in result["error"]
-
-    # Next parameter too large
-    result = await api_service.search_fixtures(next=100)
-    assert "error" in result
-    assert "2 digits or less" in result["error"]
+    result1 = await api_service_with_stubs.search_fixtures(id=1035000)
+    result2 = await api_service_with_stubs.search_fixtures(id=1035000)
 
+    assert mock_get.call_count == 1
+    assert result2 is result1
 
-# Tests for get_team_statistics_formatted method (moved from test_tools/test_statistics.py)
 
+@pytest.mark.search
 @pytest.mark.asyncio
-async def test_get_team_statistics_formatted(api_service, cache_service, mock_statistics_response):
-    """Test getting formatted team statistics."""
-    api_service.cache_service = cache_service
+@pytest.mark.parametrize(
+    "status,completed",
+    [
+        *((status, True) for status in ("FT", "AET", "PEN", "PST", "CANC", "ABD", "AWD", "WO")),
+        *((status, False) for status in ("TBD", "NS", "1H", "HT", "2H", "ET", "P", "LIVE")),
+    ],
+)
+async def test_search_fixtures_cache_type_by_status(api_service_with_stubs, cache_service, status, completed):
+    """Test that only finished fixtures are cached with the completed (permanent) TTL."""
+    api_service_with_stubs.get_fixtures.return_value = make_fixture_response(status=status)
+
+    await api_service_with_stubs.search_fixtures(id=1035000)
+
+    entry = cache_service.cache["fixtures:id:1035000"]
+    assert (entry.expires_at == float("inf")) is completed
+
+
+@pytest.mark.search
+@pytest.mark.parametrize(
+    "value,valid",
+    [
+        ("2024-01-15", True),
+        ("2024-02-29", True),
+        # Well-formed but not a real calendar date
+        ("2023-02-29", False),
+        ("2024-02-30", False),
+        ("2024-13-01", False),
+        # Wrong shape
+        ("15/01/2024", False),
+        ("2024/01/15", False),
+        ("2024-1-15", False),
+        ("20240115", False),
+        ("2024-01-15T00:00", False),
+        ("abcd-ef-gh", False),
+        ("", False),
+    ],
+)
+def test_is_valid_date(value, valid):
+    """Test the date validator shared by the search and tool methods."""
+    assert _is_valid_date(value) is valid
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_request_ids_restart_in_forked_child():
+    """Test that a forked worker gets its own request ID prefix and counter."""
+    _new_request_id()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, _new_request_id().encode())
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as pipe:
+        child_id = pipe.read().decode()
+    os.waitpid(pid, 0)
+
+    assert child_id == f"{pid}-0"
+
+
+_STATS_ARGS = {"league": 39, "season": 2023, "team": 33}
 
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_statistics_response)
 
-    with patch.object(api_service, "get_team_statistics", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
-
-        result = await api_service.get_team_statistics_formatted(
-            league=39,
-            season=2023,
-            team=33
-        )
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method,kwargs,expected",
+    [
+        # Search string too short
+        pytest.param("search_teams", {"search": "ab"}, "at least 3 characters", marks=pytest.mark.search),
+        # Invalid date formats
+        pytest.param("search_fixtures", {"date": "15/01/2024"}, "YYYY-MM-DD format", marks=pytest.mark.search),
+        pytest.param("search_fixtures", {"from_date": "15/01/2024"}, "YYYY-MM-DD format", marks=pytest.mark.search),
+        pytest.param("search_fixtures", {"to_date": "2024/01/15"}, "YYYY-MM-DD format", marks=pytest.mark.search),
+        pytest.param(
+            "get_team_statistics_formatted", {**_STATS_ARGS, "date": "15/01/2024"}, "YYYY-MM-DD format",
+            marks=pytest.mark.tools,
+        ),
+        # Filters that need a season
+        pytest.param("search_fixtures", {"league": 39}, "'season' is required", marks=pytest.mark.search),
+        pytest.param("search_fixtures", {"team": 33}, "'season' is required", marks=pytest.mark.search),
+        # Last/next parameters too large
+        pytest.param("search_fixtures", {"last": 100}, "2 digits or less", marks=pytest.mark.search),
+        pytest.param("search_fixtures", {"next": 100}, "2 digits or less", marks=pytest.mark.search),
+        # Invalid h2h format
+        pytest.param("get_head2head_formatted", {"h2h": "33"}, "team1-team2", marks=pytest.mark.tools),
+    ],
+)
+async def test_parameter_validation(api_service, method, kwargs, expected):
+    """Test parameter validation in the search and formatted tool methods."""
+    result = await getattr(api_service, method)(**kwargs)
 
-        assert "statistics" in result
-        stats = result["statistics"]
+    assert "error" in result
+    assert expected in result["error"]
 
-        assert stats["team"]["id"] == 33
-        assert stats["team"]["name"] == "Manchester United"
-        assert stats["form"] == "WDWLW"
-        assert stats["fixtures"]["played"]["total"] == 20
-        assert stats["goals"]["for"]["total"]["total"] == 45
-        assert stats["clean_sheet"]["total"] == 7
 
-        mock_get.assert_called_once_with(
-            league=39,
-            season=2023,
-            team=33,
-            date=None
-        )
+_NO_TEAM_FILTERS = dict.fromkeys(
+    ("id", "name", "league", "season", "country", "code", "venue", "search")
+)
 
 
 @pytest.mark.asyncio
-async def test_get_team_statistics_formatted_with_date(api_service, cache_service, mock_statistics_response):
-    """Test getting formatted team statistics with date snapshot."""
-    api_service.cache_service = cache_service
-
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_statistics_response)
-
-    with patch.object(api_service, "get_team_statistics", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
-
-        result = await api_service.get_team_statistics_formatted(
-            league=39,
-            season=2023,
-            team=33,
-            date="2024-01-15"
-        )
+@pytest.mark.parametrize(
+    "method,endpoint,response,kwargs,forwarded",
+    [
+        pytest.param(
+            "search_teams", "get_teams", "team_api_response",
+            {"id": 33}, {**_NO_TEAM_FILTERS, "id": 33},
+            marks=pytest.mark.search,
+        ),
+        pytest.param(
+            "search_teams", "get_teams", "team_api_response",
+            {"name": "Manchester United", "league": 39, "season": 2023, "country": "England"},
+            {
+                **_NO_TEAM_FILTERS,
+                "name": "Manchester United", "league": 39, "season": 2023, "country": "England",
+            },
+            marks=pytest.mark.search,
+        ),
+        pytest.param(
+            "search_fixtures", "get_fixtures", "fixture_api_response",
+            {"id": 1035000}, {"id": 1035000},
+            marks=pytest.mark.search,
+        ),
+        pytest.param(
+            "get_team_statistics_formatted", "get_team_statistics", "statistics_api_response",
+            _STATS_ARGS, {**_STATS_ARGS, "date": None},
+            marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_team_statistics_formatted", "get_team_statistics", "statistics_api_response",
+            {**_STATS_ARGS, "date": "2024-01-15"}, {**_STATS_ARGS, "date": "2024-01-15"},
+            marks=pytest.mark.tools,
+        ),
+    ],
+)
+async def test_params_forwarded(
+    api_service_with_stubs, request, method, endpoint, response, kwargs, forwarded
+):
+    """Test that search and tool parameters are passed through to the API endpoint."""
+    mock_get = getattr(api_service_with_stubs, endpoint)
+    mock_get.return_value = request.getfixturevalue(response)
+
+    result = await getattr(api_service_with_stubs, method)(**kwargs)
+
+    assert "error" not in result
+    mock_get.assert_called_once_with(**forwarded)
 
-        assert "statistics" in result
-        mock_get.assert_called_once_with(
-            league=39,
-            season=2023,
-            team=33,
-            date="2024-01-15"
-        )
 
+# Tests for get_team_statistics_formatted method (moved from test_tools/test_statistics.py)
 
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_team_statistics_formatted_date_validation(api_service, cache_service):
-    """Test date validation in statistics."""
-    api_service.cache_service = cache_service
+async def test_get_team_statistics_formatted(api_service_with_stubs, statistics_api_response):
+    """Test getting formatted team statistics."""
+    api_service_with_stubs.get_team_statistics.return_value = statistics_api_response
 
-    # Invalid date format
-    result = await api_service.get_team_statistics_formatted(
+    result = await api_service_with_stubs.get_team_statistics_formatted(
         league=39,
         season=2023,
-        team=33,
-        date="15/01/2024"
+        team=33
     )
 
-    assert "error" in result
-    assert "YYYY-MM-DD format" in result["error"]
+    assert "statistics" in result
+    stats = result["statistics"]
 
+    assert stats["team"]["id"] == 33
+    assert stats["team"]["name"] == "Manchester United"
+    assert stats["form"] == "WDWLW"
+    assert stats["fixtures"]["played"]["total"] == 20
+    assert stats["goals"]["for"]["total"]["total"] == 45
+    assert stats["clean_sheet"]["total"] == 7
+    assert stats["cards"]["yellow"]["46-60"]["total"] == 8
+    assert stats["cards"]["red"]["106-120"]["total"] is None
 
-# Tests for new tool methods
 
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_standings_formatted(api_service, cache_service):
-    """Test getting formatted standings."""
-    api_service.cache_service = cache_service
-
-    mock_standings_response = {
-        "response": [{
-            "league": {
-                "id": 39,
-                "name": "Premier League",
-                "country": "England",
-                "logo": "logo.png",
-                "flag": "flag.png",
-                "season": 2023,
-                "standings": [[
-                    {
-                        "rank": 1,
-                        "team": {"id": 33, "name": "Manchester United", "logo": "team.png"},
-                        "points": 75,
-                        "goalsDiff": 35,
-                        "group": "Premier League",
-                        "form": "WDWWW",
-                        "status": "same",
-                        "description": "Champions League",
-                        "all": {"played": 30, "win": 23, "draw": 6, "lose": 1, "goals": {"for": 70, "against": 35}},
-                        "home": {"played": 15, "win": 12, "draw": 3, "lose": 0, "goals": {"for": 40, "against": 15}},
-                        "away": {"played": 15, "win": 11, "draw": 3, "lose": 1, "goals": {"for": 30, "against": 20}},
-                        "update": "2024-01-15"
-                    }
-                ]]
-            }
-        }]
-    }
-
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**{"get": "/standings", "parameters": {}, "errors": [], "results": 1, "response": mock_standings_response["response"]})
-
-    with patch.object(api_service, "get_standings", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
-
-        result = await api_service.get_standings_formatted(league=39, season=2023)
-
-        assert "standings" in result
-        assert result["count"] == 1
-        assert result["standings"][0]["rank"] == 1
-        assert result["standings"][0]["team"]["name"] == "Manchester United"
-        assert result["standings"][0]["points"] == 75
-
-
-@pytest.mark.asyncio
-async def test_get_head2head_formatted(api_service, cache_service, mock_fixture_response):
-    """Test getting formatted head-to-head fixtures."""
-    api_service.cache_service = cache_service
+async def test_get_team_statistics_formatted_with_cache(api_service_with_stubs, cache_service, statistics_api_response):
+    """Test that statistics are cached compactly and rebuilt on a cache hit."""
+    mock_get = api_service_with_stubs.get_team_statistics
+    mock_get.return_value = statistics_api_response
 
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**mock_fixture_response)
+    result1 = await api_service_with_stubs.get_team_statistics_formatted(league=39, season=2023, team=33)
+    result2 = await api_service_with_stubs.get_team_statistics_formatted(league=39, season=2023, team=33)
 
-    with patch.object(api_service, "get_fixtures_head2head", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    assert mock_get.call_count == 1
+    assert result1 == result2
 
-        result = await api_service.get_head2head_formatted(h2h="33-40")
+    # The cached entry holds encoded leaf values rather than the nested dict
+    cached = next(iter(cache_service.cache.values())).value
+    assert isinstance(cached, bytes)
+    assert b"yellow" not in cached
 
-        assert "fixtures" in result
-        assert "statistics" in result
-        assert result["count"] == 1
-        assert "team1_wins" in result["statistics"]
-        assert "team2_wins" in result["statistics"]
-        assert "draws" in result["statistics"]
 
+# Tests for new tool methods
 
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_head2head_formatted_validation(api_service, cache_service):
-    """Test h2h parameter validation."""
-    api_service.cache_service = cache_service
+async def test_get_standings_formatted(api_service_with_stubs, standings_api_response):
+    """Test getting formatted standings."""
+    api_service_with_stubs.get_standings = AsyncReturn(standings_api_response)
 
-    # Invalid h2h format
-    result = await api_service.get_head2head_formatted(h2h="33")
-    assert "error" in result
-    assert "team1-team2" in result["error"]
+    result = await api_service_with_stubs.get_standings_formatted(league=39, season=2023)
 
+    assert "standings" in result
+    assert result["count"] == 1
+    assert result["standings"][0]["rank"] == 1
+    assert result["standings"][0]["team"]["name"] == "Manchester United"
+    assert result["standings"][0]["points"] == 75
 
+
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_fixture_statistics_formatted(api_service, cache_service):
-    """Test getting formatted fixture statistics."""
-    api_service.cache_service = cache_service
+async def test_get_head2head_formatted(api_service_with_stubs, fixture_api_response):
+    """Test getting formatted head-to-head fixtures."""
+    api_service_with_stubs.get_fixtures_head2head = AsyncReturn(fixture_api_response)
 
-    mock_stats_response = {
-        "response": [
-            {
-                "team": {"id": 33, "name": "Manchester United", "logo": "team.png"},
-                "statistics": [
-                    {"type": "Shots on Goal", "value": 6},
-                    {"type": "Total Shots", "value": 15},
-                    {"type": "Possession", "value": "58%"},
-                    {"type": "Passes", "value": 456}
-                ]
-            },
-            {
-                "team": {"id": 40, "name": "Liverpool", "logo": "team2.png"},
-                "statistics": [
-                    {"type": "Shots on Goal", "value": 4},
-                    {"type": "Total Shots", "value": 12},
-                    {"type": "Possession", "value": "42%"},
-                    {"type": "Passes", "value": 367}
-                ]
-            }
-        ]
-    }
+    result = await api_service_with_stubs.get_head2head_formatted(h2h="33-40")
+
+    assert "fixtures" in result
+    assert "statistics" in result
+    assert result["count"] == 1
+    assert "team1_wins" in result["statistics"]
+    assert "team2_wins" in result["statistics"]
+    assert "draws" in result["statistics"]
 
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**{"get": "/fixtures/statistics", "parameters": {}, "errors": [], "results": 2, "response": mock_stats_response["response"]})
 
-    with patch.object(api_service, "get_fixture_statistics", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+@pytest.mark.tools
+@pytest.mark.asyncio
+async def test_get_fixture_statistics_formatted(api_service_with_stubs, fixture_statistics_api_response):
+    """Test getting formatted fixture statistics."""
+    api_service_with_stubs.get_fixture_statistics = AsyncReturn(fixture_statistics_api_response)
 
-        result = await api_service.get_fixture_statistics_formatted(fixture=1035000)
+    result = await api_service_with_stubs.get_fixture_statistics_formatted(fixture=1035000)
 
-        assert "teams" in result
-        assert len(result["teams"]) == 2
-        assert result["teams"][0]["statistics"]["Shots on Goal"] == 6
-        assert result["teams"][0]["statistics"]["Possession"] == "58%"
+    assert "teams" in result
+    assert len(result["teams"]) == 2
+    assert result["teams"][0]["statistics"]["Shots on Goal"] == 6
+    assert result["teams"][0]["statistics"]["Possession"] == "58%"
 
 
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_fixture_events_formatted(api_service, cache_service):
+async def test_get_fixture_events_formatted(api_service_with_stubs, fixture_events_api_response):
     """Test getting formatted fixture events."""
-    api_service.cache_service = cache_service
-
-    mock_events_response = {
-        "response": [
-            {
-                "time": {"elapsed": 15, "extra": None},
-                "team": {"id": 33, "name": "Manchester United", "logo": "team.png"},
-                "player": {"id": 1, "name": "Rashford"},
-                "assist": {"id": 2, "name": "Bruno"},
-                "type": "Goal",
-                "detail": "Normal Goal",
-                "comments": None
-            },
-            {
-                "time": {"elapsed": 45, "extra": 2},
-                "team": {"id": 40, "name": "Liverpool", "logo": "team2.png"},
-                "player": {"id": 3, "name": "Salah"},
-                "assist": {},
-                "type": "Card",
-                "detail": "Yellow Card",
-                "comments": "Foul"
-            }
-        ]
-    }
-
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**{"get": "/fixtures/events", "parameters": {}, "errors": [], "results": 2, "response": mock_events_response["response"]})
-
-    with patch.object(api_service, "get_fixture_events", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    api_service_with_stubs.get_fixture_events = AsyncReturn(fixture_events_api_response)
 
-        result = await api_service.get_fixture_events_formatted(fixture=1035000)
+    result = await api_service_with_stubs.get_fixture_events_formatted(fixture=1035000)
 
-        assert "events" in result
-        assert result["count"] == 2
-        assert result["events"][0]["type"] == "Goal"
-        assert result["events"][0]["player"]["name"] == "Rashford"
+    assert "events" in result
+    assert result["count"] == 2
+    assert result["events"][0]["type"] == "Goal"
+    assert result["events"][0]["player"]["name"] == "Rashford"
 
 
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_fixture_lineups_formatted(api_service, cache_service):
+async def test_get_fixture_lineups_formatted(api_service_with_stubs, fixture_lineups_api_response):
     """Test getting formatted fixture lineups."""
-    api_service.cache_service = cache_service
-
-    mock_lineups_response = {
-        "response": [
-            {
-                "team": {"id": 33, "name": "Manchester United", "logo": "team.png"},
-                "formation": "4-2-3-1",
-                "startXI": [
-                    {"player": {"id": 1, "name": "De Gea", "number": 1, "pos": "G"}}
-                ],
-                "substitutes": [
-                    {"player": {"id": 2, "name": "Heaton", "number": 22, "pos": "G"}}
-                ],
-                "coach": {"id": 100, "name": "Ten Hag", "photo": "coach.png"}
-            }
-        ]
-    }
-
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**{"get": "/fixtures/lineups", "parameters": {}, "errors": [], "results": 1, "response": mock_lineups_response["response"]})
+    api_service_with_stubs.get_fixture_lineups = AsyncReturn(fixture_lineups_api_response)
 
-    with patch.object(api_service, "get_fixture_lineups", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    result = await api_service_with_stubs.get_fixture_lineups_formatted(fixture=1035000)
 
-        result = await api_service.get_fixture_lineups_formatted(fixture=1035000)
-
-        assert "lineups" in result
-        assert len(result["lineups"]) == 1
-        assert result["lineups"][0]["formation"] == "4-2-3-1"
-        assert result["lineups"][0]["coach"]["name"] == "Ten Hag"
+    assert "lineups" in result
+    assert len(result["lineups"]) == 1
+    assert result["lineups"][0]["formation"] == "4-2-3-1"
+    assert result["lineups"][0]["coach"]["name"] == "Ten Hag"
 
 
+@pytest.mark.tools
 @pytest.mark.asyncio
-async def test_get_predictions_formatted(api_service, cache_service):
+async def test_get_predictions_formatted(api_service_with_stubs, predictions_api_response):
     """Test getting formatted predictions."""
-    api_service.cache_service = cache_service
-
-    mock_predictions_response = {
-        "response": [{
-            "winner": {"id": 33, "name": "Manchester United", "comment": "Win or draw"},
-            "win_or_draw": True,
-            "under_over": "Over 2.5",
-            "goals": {"home": "1.5-2.5", "away": "0.5-1.5"},
-            "advice": "Manchester United or draw",
-            "percent": {"home": "45%", "draw": "30%", "away": "25%"},
-            "league": {"id": 39, "name": "Premier League"},
-            "teams": {
-                "home": {"id": 33, "name": "Manchester United"},
-                "away": {"id": 40, "name": "Liverpool"}
-            },
-            "comparison": {
-                "form": {"home": "60%", "away": "40%"},
-                "att": {"home": "55%", "away": "45%"},
-                "def": {"home": "52%", "away": "48%"}
-            },
-            "h2h": []
-        }]
-    }
+    api_service_with_stubs.get_predictions = AsyncReturn(predictions_api_response)
 
-    from mcp_server_api_sports.models import ApiResponse
-    api_response = ApiResponse(**{"get": "/predictions", "parameters": {}, "errors": [], "results": 1, "response": mock_predictions_response["response"]})
+    result = await api_service_with_stubs.get_predictions_formatted(fixture=1035000)
 
-    with patch.object(api_service, "get_predictions", new_callable=AsyncMock) as mock_get:
-        mock_get.return_value = api_response
+    assert "predictions" in result
+    assert result["predictions"]["winner"]["name"] == "Manchester United"
+    assert result["predictions"]["advice"] == "Manchester United or draw"
+    assert result["predictions"]["under_over"] == "Over 2.5"
 
-        result = await api_service.get_predictions_formatted(fixture=1035000)
 
-        assert "predictions" in result
-        assert result["predictions"]["winner"]["name"] == "Manchester United"
-        assert result["predictions"]["advice"] == "Manchester United or draw"
-        assert result["predictions"]["under_over"] == "Over 2.5"
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "method,endpoint,kwargs,expected",
+    [
+        pytest.param(
+            "search_teams", "get_teams", {"id": 33}, "Failed to search teams",
+            marks=pytest.mark.search,
+        ),
+        pytest.param(
+            "search_fixtures", "get_fixtures", {"id": 1035000}, "Failed to retrieve fixtures",
+            marks=pytest.mark.search,
+        ),
+        pytest.param(
+            "get_team_statistics_formatted", "get_team_statistics", _STATS_ARGS,
+            "Failed to retrieve team statistics", marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_standings_formatted", "get_standings", {"league": 39, "season": 2023},
+            "Failed to retrieve standings", marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_head2head_formatted", "get_fixtures_head2head", {"h2h": "33-40"},
+            "Failed to retrieve head-to-head fixtures", marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_fixture_statistics_formatted", "get_fixture_statistics", {"fixture": 1035000},
+            "Failed to retrieve fixture statistics", marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_fixture_events_formatted", "get_fixture_events", {"fixture": 1035000},
+            "Failed to retrieve fixture events", marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_fixture_lineups_formatted", "get_fixture_lineups", {"fixture": 1035000},
+            "Failed to retrieve fixture lineups", marks=pytest.mark.tools,
+        ),
+        pytest.param(
+            "get_predictions_formatted", "get_predictions", {"fixture": 1035000},
+            "Failed to retrieve predictions", marks=pytest.mark.tools,
+        ),
+    ],
+)
+async def test_error_handling(api_service_with_stubs, method, endpoint, kwargs, expected):
+    """Test that API errors are reported as an error result by each method."""
+    setattr(api_service_with_stubs, endpoint, AsyncRaise(Exception("API Error")))
+
+    result = await getattr(api_service_with_stubs, method)(**kwargs)
+
+    assert "error" in result
+    assert expected in result["error"]